@@ -0,0 +1,197 @@
+"""
+Lab 01 ▸ Batched Vacuum-World Simulator (N-square linear world, NumPy)
+======================================================================
+Runs *thousands* of independent vacuum worlds in lock-step instead of one
+world through the string-keyed `Environment` dict.
+
+Takeaways:
+    • World state  = `dirt` (worlds × squares) bool array + `pos` int vector.
+    • One tick     = percept → policy → actuators applied to **every** world at once.
+    • Policies     = vectorised copies of `REFLEX_VACUUM_AGENT` (homework 1)
+                     and `MODEL_BASED_AGENT` (homework 2); traces match the
+                     scalar `run()` line-for-line (see `check_against_scalar`).
+    • Performance  = +1 per clean square per time step (AIMA measure), summed
+                     per world after each action.
+
+Run:
+    python batch_vacuum_sim.py                       # 10 000 random 4-square worlds
+    python batch_vacuum_sim.py --worlds 50000 --squares 8 --policy model
+"""
+
+import argparse
+import contextlib
+import io
+import time
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+# ── action codes (index into ACTIONS) ───────────────────────────────────────
+SUCK, LEFT, RIGHT, NOOP = 0, 1, 2, 3
+ACTIONS: Tuple[str, ...] = ("Suck", "Left", "Right", "NoOp")
+STATUS: Tuple[str, str] = ("Clean", "Dirty")  # bool → label
+
+# ── vectorised policies ─────────────────────────────────────────────────────
+
+def reflex_policy(status: np.ndarray, pos: np.ndarray, n_squares: int) -> np.ndarray:
+    """Vectorised `REFLEX_VACUUM_AGENT`: Suck if dirty, else Right until the end."""
+    act = np.where(pos < n_squares - 1, RIGHT, LEFT)
+    act[status] = SUCK
+    return act
+
+
+def model_policy(status: np.ndarray, pos: np.ndarray, model: np.ndarray) -> np.ndarray:
+    """Vectorised `MODEL_BASED_AGENT`; *model* (worlds × squares) is updated in place."""
+    rows = np.arange(len(pos))
+    model[rows, pos] = status                       # 1) percept → model
+
+    # 3) nearest dirty square in the model; argmin keeps the lowest index on
+    #    ties, exactly like `min()` over the enumerated list in the scalar code.
+    dist = np.abs(np.arange(model.shape[1]) - pos[:, None])
+    dist = np.where(model, dist, model.shape[1])
+    target = dist.argmin(axis=1)
+    any_dirty = model.any(axis=1)
+
+    act = np.where(target > pos, RIGHT, LEFT)
+    act[~any_dirty] = NOOP
+    act[status] = SUCK                              # 2) dirty here ⇒ Suck
+    return act
+
+# ── batched environment step ────────────────────────────────────────────────
+
+def actuate(dirt: np.ndarray, pos: np.ndarray, act: np.ndarray) -> np.ndarray:
+    """Apply *act* to every world; return bool mask of squares actually cleaned."""
+    rows = np.arange(len(pos))
+    sucked = (act == SUCK) & dirt[rows, pos]
+    dirt[rows[sucked], pos[sucked]] = False
+    pos += (act == RIGHT) & (pos < dirt.shape[1] - 1)
+    pos -= (act == LEFT) & (pos > 0)
+    return sucked
+
+
+def simulate(dirt: np.ndarray,
+             pos: np.ndarray,
+             steps: int,
+             policy: str = "reflex",
+             model_init: bool = True,
+             record: bool = False) -> Tuple[np.ndarray, Optional[Dict[str, np.ndarray]]]:
+    """
+    Run *steps* ticks over all worlds.
+
+    *dirt* (worlds × squares, bool) and *pos* (worlds,) are copied, not mutated.
+    *model_init* is the model agent's prior for every square (`DIRTY_INIT == "Dirty"`).
+    Returns (scores, trace); *trace* holds (steps × worlds) arrays when *record*.
+    """
+    dirt = np.array(dirt, dtype=bool)
+    pos = np.array(pos, dtype=np.intp)
+    n_worlds, n_squares = dirt.shape
+    rows = np.arange(n_worlds)
+    dirty_left = dirt.sum(axis=1)
+    scores = np.zeros(n_worlds, dtype=np.int64)
+
+    model = np.full(dirt.shape, model_init, dtype=bool) if policy == "model" else None
+    trace = None
+    if record:
+        shape = (steps, n_worlds)
+        trace = {k: np.empty(shape, dtype=np.intp) for k in ("loc", "act", "nloc")}
+        trace.update({k: np.empty(shape, dtype=bool) for k in ("status", "nstatus")})
+        if model is not None:
+            trace["model_dirty"] = np.empty(shape, dtype=np.intp)
+
+    for t in range(steps):
+        status = dirt[rows, pos]
+        if record:
+            trace["loc"][t], trace["status"][t] = pos, status
+            if model is not None:
+                trace["model_dirty"][t] = model.sum(axis=1)
+
+        if model is None:
+            act = reflex_policy(status, pos, n_squares)
+        else:
+            act = model_policy(status, pos, model)
+        dirty_left -= actuate(dirt, pos, act)
+        scores += n_squares - dirty_left
+
+        if record:
+            trace["act"][t], trace["nloc"][t] = act, pos
+            trace["nstatus"][t] = dirt[rows, pos]
+    return scores, trace
+
+# ── world generation & trace formatting ─────────────────────────────────────
+
+def random_worlds(n_worlds: int, n_squares: int, p_dirty: float = 0.5,
+                  seed: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """Return (dirt, pos) for *n_worlds* random worlds."""
+    rng = np.random.default_rng(seed)
+    dirt = rng.random((n_worlds, n_squares)) < p_dirty
+    pos = rng.integers(0, n_squares, n_worlds)
+    return dirt, pos
+
+
+def format_trace(trace: Dict[str, np.ndarray], world: int, squares: Sequence[str]) -> str:
+    """Render *world*'s trace exactly like the scalar `run()` prints it."""
+    model = "model_dirty" in trace
+    if model:
+        lines = ["Current                         New     ModelDirty?",
+                 "loc      status  act   loc      status  remaining"]
+    else:
+        lines = ["Current                         New",
+                 "loc      status  act   loc      status"]
+    for t in range(len(trace["loc"])):
+        line = (f"{squares[trace['loc'][t, world]]:8}{STATUS[int(trace['status'][t, world])]:8}"
+                f"{ACTIONS[trace['act'][t, world]]:6}{squares[trace['nloc'][t, world]]:8}"
+                f"{STATUS[int(trace['nstatus'][t, world])]:8}")
+        if model:
+            line += f"{trace['model_dirty'][t, world]:6}"
+        lines.append(line)
+    return "\n".join(lines) + "\n"
+
+
+def check_against_scalar(module, dirt_row: Sequence[bool], start: int, steps: int) -> bool:
+    """
+    Replay one world through the scalar *module* (homework 1 or 2) and compare
+    its printed trace with the batched one.  Resets the module's globals first.
+    """
+    squares: List[str] = module.SQUARES
+    for label, d in zip(squares, dirt_row):
+        module.Environment[label] = STATUS[bool(d)]
+    module.Environment["Current"] = squares[start]
+    policy = "model" if hasattr(module, "MODEL_BASED_AGENT") else "reflex"
+    if policy == "model":
+        module.reset_model()
+
+    buf = io.StringIO()
+    with contextlib.redirect_stdout(buf):
+        module.run(steps)
+
+    _, trace = simulate(np.array([dirt_row]), np.array([start]), steps, policy,
+                        model_init=getattr(module, "DIRTY_INIT", "Dirty") == "Dirty",
+                        record=True)
+    return buf.getvalue() == format_trace(trace, 0, squares)
+
+# ── CLI demo ────────────────────────────────────────────────────────────────
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Batched N-square vacuum-world simulator")
+    parser.add_argument("--worlds", type=int, default=10_000, help="number of random worlds")
+    parser.add_argument("--squares", type=int, default=4, help="squares per world")
+    parser.add_argument("--steps", type=int, default=20, help="ticks per world")
+    parser.add_argument("--policy", choices=("reflex", "model"), default="reflex")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    dirt, pos = random_worlds(args.worlds, args.squares, seed=args.seed)
+    t0 = time.perf_counter()
+    scores, _ = simulate(dirt, pos, args.steps, args.policy)
+    dt = time.perf_counter() - t0
+
+    print(f"{args.worlds} worlds × {args.steps} steps ({args.policy}) in {dt:.3f}s "
+          f"→ {args.worlds * args.steps / dt:,.0f} world-steps/s")
+    print(f"score mean {scores.mean():.2f} | min {scores.min()} | max {scores.max()}")
+
+    # Cross-check a few worlds against the scalar homework modules (4 squares).
+    import reflex_agent_with_state
+    import reflex_vacuum_agent_homework
+    for mod in (reflex_vacuum_agent_homework, reflex_agent_with_state):
+        d4, p4 = random_worlds(5, len(mod.SQUARES), seed=args.seed)
+        ok = all(check_against_scalar(mod, d4[w], int(p4[w]), mod.STEPS) for w in range(5))
+        print(f"trace matches {mod.__name__}.run(): {ok}")
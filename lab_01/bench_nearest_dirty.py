@@ -0,0 +1,68 @@
+"""
+Lab 01 ▸ Benchmark — nearest-dirty lookup in the model-based agent
+==================================================================
+Full cleaning run on an N-square corridor (all dirty, agent starts in the
+middle) until the agent answers "NoOp".
+
+    • linear  – original `nearest_dirty()`: list every dirty index, then `min`
+                ⇒ O(N) per step, O(N²) per run.
+    • fenwick – `DirtyIndex` Fenwick tree ⇒ O(log N) update + lookup per step.
+
+Run:
+    python bench_nearest_dirty.py
+    python bench_nearest_dirty.py --sizes 1000 10000 100000 1000000 --max-linear 10000
+"""
+
+import argparse
+import time
+from typing import Optional
+
+from vacuum_world import ModelBasedAgent, VacuumEnvironment
+
+
+class LinearModelAgent(ModelBasedAgent):
+    """Model-based agent with the original O(N) scan (reference only)."""
+
+    __slots__ = ()
+
+    def nearest_dirty(self, cur_idx: int) -> Optional[int]:
+        dirty_indices = [i for i, s in enumerate(self.model) if s == "Dirty"]
+        if not dirty_indices:
+            return None
+        return min(dirty_indices, key=lambda i: abs(i - cur_idx))
+
+
+def clean_corridor(agent_cls, n: int):
+    """Return (steps, seconds) to clean an all-dirty *n*-square corridor."""
+    squares = range(n)
+    env = VacuumEnvironment(squares, start=n // 2)
+    agent = agent_cls(squares)
+    steps = 0
+    t0 = time.perf_counter()
+    while True:
+        act = agent(env.sensors())
+        if act == "NoOp":
+            break
+        env.actuators(act)
+        steps += 1
+    return steps, time.perf_counter() - t0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Scaling of nearest-dirty lookup")
+    parser.add_argument("--sizes", type=int, nargs="+",
+                        default=[1_000, 3_000, 10_000, 100_000, 1_000_000])
+    parser.add_argument("--max-linear", type=int, default=3_000,
+                        help="skip the O(N²) reference above this size")
+    args = parser.parse_args()
+
+    print(f"{'N':>9} {'steps':>9} {'linear s':>10} {'fenwick s':>10} {'µs/step':>9} {'speed-up':>9}")
+    for n in args.sizes:
+        steps, t_new = clean_corridor(ModelBasedAgent, n)
+        if n <= args.max_linear:
+            steps_old, t_old = clean_corridor(LinearModelAgent, n)
+            assert steps_old == steps, "implementations disagree"
+            old, ratio = f"{t_old:10.3f}", f"{t_old / t_new:8.1f}×"
+        else:
+            old, ratio = f"{'—':>10}", f"{'—':>9}"
+        print(f"{n:9} {steps:9} {old} {t_new:10.3f} {t_new / steps * 1e6:9.2f} {ratio}")
@@ -0,0 +1,221 @@
+"""
+Lab 01 ▸ Agent Throughput Benchmark Suite
+=========================================
+Runs every lab_01 agent on a fixed set of workloads and records:
+
+    • steps/second      – best of `--repeat` timed runs
+    • peak memory       – `tracemalloc` peak of one extra (untimed) run
+    • performance       – AIMA score (+1 per clean square per step) and the
+                          mean fraction of clean squares over the run
+    • cache hits        – hit rate of the `lazy` table's LRU (lazy rows only)
+
+Results are written as JSON so two commits can be compared:
+
+    python benchmark.py --out before.json
+    ... change an agent ...
+    python benchmark.py --out after.json --compare before.json
+
+Two families of agents, all stepped by `vacuum_world.run` so the numbers
+compare directly:
+
+    • `vacuum_world` objects – `table` (trie), `lazy` and `rules` live in the
+      2-square world; `reflex` and `model` are timed across sizes.
+    • `lab:*` – the exercise scripts' own agent functions in their own world
+      size: REFLEX_VACUUM_AGENT (exercise 2, homework 1), MODEL_BASED_AGENT,
+      SIMPLE_REFLEX_AGENT, COMPILED_REFLEX_AGENT, TABLE_DRIVEN_AGENT and
+      TRIE_DRIVEN_AGENT.  Their module state is reset before every run.
+
+The lab's percept table only covers 3 steps (the agent answers None after
+that), so table workloads use a table recorded from one reflex run of the
+same horizon; its size is reported as `table entries` (built once, outside
+the timed and traced runs).  TABLE_DRIVEN_AGENT
+hashes its whole history each step (O(T)), hence its shorter horizon.
+"""
+
+import argparse
+import json
+import platform
+import subprocess
+import time
+import tracemalloc
+from typing import Any, Dict, List
+
+import reflex_agent_with_state
+import reflex_vacuum_agent
+import reflex_vacuum_agent_homework
+import simple_reflex_agent
+import table_driven_agent
+from table_driven_agent import REFLEX_POLICY, PerceptTrie
+from vacuum_world import TableDrivenAgent, VacuumEnvironment, make_agent, run
+
+# ── standard workloads ──────────────────────────────────────────────────────
+STANDARD_WORKLOADS: List[Dict[str, Any]] = (
+    [{"agent": kind, "squares": 2, "steps": 10_000} for kind in ("table", "lazy", "rules")]
+    + [{"agent": kind, "squares": n, "steps": steps}
+       for kind in ("reflex", "model")
+       for n, steps in ((4, 10_000), (64, 10_000), (1_024, 50_000), (16_384, 100_000))]
+    + [{"agent": kind, "squares": 2, "steps": 10_000}
+       for kind in ("lab:reflex", "lab:rules", "lab:compiled", "lab:trie")]
+    + [{"agent": "lab:table", "squares": 2, "steps": 2_000}]
+    + [{"agent": "lab:homework", "squares": len(reflex_vacuum_agent_homework.SQUARES), "steps": 10_000},
+       {"agent": "lab:model", "squares": len(reflex_agent_with_state.SQUARES), "steps": 10_000}]
+)
+QUICK_WORKLOADS = [w for w in STANDARD_WORKLOADS if w["squares"] <= 64]
+
+
+def workload_name(w: Dict[str, Any]) -> str:
+    return f"{w['agent']}/N={w['squares']}/T={w['steps']}"
+
+
+# ── tables covering the whole horizon (built once, untimed) ────────────────
+_HORIZON: Dict[tuple, Any] = {}
+
+
+def _reflex_run(steps: int):
+    """(percept, action) pairs of REFLEX_POLICY in the 2-square world."""
+    env = VacuumEnvironment(["A", "B"])
+    for _ in range(steps):
+        percept = env.sensors()
+        action = REFLEX_POLICY(percept)
+        env.actuators(action)
+        yield percept, action
+
+
+def horizon_trie(steps: int) -> PerceptTrie:
+    key = ("trie", steps)
+    if key not in _HORIZON:
+        _HORIZON[key] = PerceptTrie.from_run(_reflex_run(steps))
+    return _HORIZON[key]
+
+
+def horizon_table(steps: int) -> Dict[tuple, str]:
+    key = ("table", steps)
+    if key not in _HORIZON:
+        history, tbl = [], {}
+        for percept, action in _reflex_run(steps):
+            history.append(percept)
+            tbl[tuple(history)] = action
+        _HORIZON[key] = tbl
+    return _HORIZON[key]
+
+# ── lab-script agents (module globals ⇒ reset before each run) ──────────────
+
+def _lab_agent(kind: str, steps: int):
+    """(squares, agent function, table entries or None) for a `lab:*` workload."""
+    if kind == "lab:reflex":
+        return ["A", "B"], reflex_vacuum_agent.REFLEX_VACUUM_AGENT, None
+    if kind == "lab:homework":
+        return reflex_vacuum_agent_homework.SQUARES, reflex_vacuum_agent_homework.REFLEX_VACUUM_AGENT, None
+    if kind == "lab:model":
+        reflex_agent_with_state.reset_model()
+        return reflex_agent_with_state.SQUARES, reflex_agent_with_state.MODEL_BASED_AGENT, None
+    if kind == "lab:rules":
+        return ["A", "B"], simple_reflex_agent.SIMPLE_REFLEX_AGENT, None
+    if kind == "lab:compiled":
+        return ["A", "B"], simple_reflex_agent.COMPILED_REFLEX_AGENT, len(simple_reflex_agent.COMPILED.table)
+    if kind == "lab:table":
+        table_driven_agent.table = horizon_table(steps)
+        table_driven_agent.percepts.clear()
+        return ["A", "B"], table_driven_agent.TABLE_DRIVEN_AGENT, len(table_driven_agent.table)
+    if kind == "lab:trie":
+        table_driven_agent.trie = horizon_trie(steps)
+        table_driven_agent.cursor = PerceptTrie.ROOT
+        return ["A", "B"], table_driven_agent.TRIE_DRIVEN_AGENT, len(table_driven_agent.trie)
+    raise ValueError(f"unknown lab agent: {kind!r}")
+
+
+def _simulate(w: Dict[str, Any]) -> Dict[str, Any]:
+    kind, entries = w["agent"], None
+    if kind.startswith("lab:"):
+        squares, agent, entries = _lab_agent(kind, w["steps"])
+    else:
+        squares = ["A", "B"] if kind in ("table", "rules") else range(w["squares"])
+        if kind == "table":
+            agent = TableDrivenAgent(horizon_trie(w["steps"]))
+            entries = len(agent.trie)
+        else:
+            agent = make_agent(kind, squares)
+    env = VacuumEnvironment(squares)
+    result = run(env, agent, w["steps"])
+    if entries is not None:
+        result["table_entries"] = entries
+    stats = getattr(getattr(agent, "trie", None), "stats", None)
+    if stats is not None:                 # lazy table: cache effectiveness
+        result["hit_rate"] = stats()["hit_rate"]
+    return result
+
+
+def bench(w: Dict[str, Any], repeat: int) -> Dict[str, Any]:
+    """Time, memory and performance measure for one workload."""
+    _simulate(w)                          # warm-up: lazy imports, caches
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        result = _simulate(w)
+        best = min(best, time.perf_counter() - t0)
+
+    tracemalloc.start()
+    _simulate(w)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        **w,
+        "seconds": best,
+        "steps_per_s": w["steps"] / best,
+        "peak_kib": peak / 1024,
+        "score": result["score"],
+        "clean_fraction": result["score"] / (w["steps"] * w["squares"]),
+        **{k: result[k] for k in ("hit_rate", "table_entries") if k in result},
+    }
+
+
+def metadata() -> Dict[str, Any]:
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                                text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {"commit": commit, "python": platform.python_version(),
+            "machine": platform.machine(), "time": time.strftime("%Y-%m-%dT%H:%M:%S")}
+
+
+def print_table(rows: List[Dict[str, Any]], baseline: Dict[str, Dict[str, Any]]) -> None:
+    hdr = f"{'workload':28} {'steps/s':>12} {'peak KiB':>10} {'clean %':>8}"
+    print(hdr + (f" {'vs base':>8}" if baseline else ""))
+    for r in rows:
+        name = workload_name(r)
+        line = (f"{name:28} {r['steps_per_s']:12,.0f} {r['peak_kib']:10.1f} "
+                f"{100 * r['clean_fraction']:8.2f}")
+        if name in baseline:
+            line += f" {r['steps_per_s'] / baseline[name]['steps_per_s']:7.2f}×"
+            if r["score"] != baseline[name]["score"]:
+                line += "  (score changed!)"
+        if "hit_rate" in r:
+            line += f"  cache hits {100 * r['hit_rate']:.2f}%"
+        if "table_entries" in r:
+            line += f"  table entries {r['table_entries']:,}"
+        print(line)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="lab_01 agent throughput benchmark")
+    parser.add_argument("--quick", action="store_true", help="small worlds only")
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per workload")
+    parser.add_argument("--out", default=None, help="write JSON results here")
+    parser.add_argument("--compare", default=None, help="baseline JSON from an earlier commit")
+    args = parser.parse_args()
+
+    workloads = QUICK_WORKLOADS if args.quick else STANDARD_WORKLOADS
+    rows = [bench(w, args.repeat) for w in workloads]
+
+    baseline = {}
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = {workload_name(r): r for r in json.load(f)["results"]}
+    print_table(rows, baseline)
+
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump({"meta": metadata(), "results": rows}, f, indent=2)
+        print(f"\nwrote {args.out}")
@@ -0,0 +1,118 @@
+"""
+Lab 01 ▸ Bit-Packed 2D Grid Vacuum World
+========================================
+A W×H grid whose dirt is one **bit** per square (a `bytearray` bitset,
+row-major), so a 1000×1000 world costs 125 kB instead of a million-entry dict.
+
+Takeaways:
+    • Suck / move = O(1) bit or index arithmetic – no per-square objects.
+    • `dirty_count()` = popcount of the whole bitset (`int.bit_count`, done in C);
+      `all_clean()` = popcount == 0.
+    • Locations are numbered along a **serpentine** (boustrophedon) path, so
+      "Left"/"Right" walk the whole grid row by row.  The linear agents from
+      `vacuum_world` (reflex & model-based) therefore run **unchanged** through
+      the same `sensors()` / `actuators()` contract; "Up"/"Down" are accepted
+      too for genuinely 2D agents.
+
+Run:
+    python grid_vacuum_world.py                       # 1000×1000, both agents
+    python grid_vacuum_world.py --width 200 --height 200 --p-dirty 0.1
+"""
+
+import argparse
+import random
+import time
+from typing import Optional, Tuple
+
+from vacuum_world import ModelBasedAgent, ReflexVacuumAgent, run
+
+GRID_ACTIONS = frozenset({"Suck", "Left", "Right", "Up", "Down", "NoOp"})
+
+
+class GridVacuumEnvironment:
+    """W×H vacuum world; location k = k-th square along the serpentine path."""
+
+    __slots__ = ("width", "height", "squares", "current", "bits", "valid_actions")
+
+    def __init__(self, width: int, height: int, p_dirty: float = 1.0,
+                 start: int = 0, seed: Optional[int] = None):
+        self.width, self.height = width, height
+        n = width * height
+        self.squares = range(n)                 # labels = serpentine indices
+        self.current = start
+        self.valid_actions = GRID_ACTIONS
+        if p_dirty >= 1.0:
+            self.bits = bytearray(((1 << n) - 1).to_bytes((n + 7) // 8, "little"))
+        else:
+            rng = random.Random(seed)
+            self.bits = bytearray((n + 7) // 8)
+            for b in range(n):                  # one Bernoulli(p) bit per square
+                if rng.random() < p_dirty:
+                    self.bits[b >> 3] |= 1 << (b & 7)
+
+    # ── coordinates ─────────────────────────────────────────────────────────
+    def cell(self, k: int) -> Tuple[int, int]:
+        """Serpentine index → (row, col)."""
+        r, c = divmod(k, self.width)
+        return r, (self.width - 1 - c) if r & 1 else c
+
+    def index(self, r: int, c: int) -> int:
+        """(row, col) → serpentine index."""
+        return r * self.width + ((self.width - 1 - c) if r & 1 else c)
+
+    def _bit(self, k: int) -> int:
+        r, c = self.cell(k)
+        return r * self.width + c
+
+    # ── sensors & actuators ─────────────────────────────────────────────────
+    def sensors(self) -> Tuple[int, str]:
+        """Return (location, status)."""
+        b = self._bit(self.current)
+        return self.current, "Dirty" if self.bits[b >> 3] >> (b & 7) & 1 else "Clean"
+
+    def actuators(self, action: str) -> None:
+        """Safely mutate world for **valid** actions; ignore anything else."""
+        if action not in self.valid_actions:
+            return
+        k = self.current
+        if action == "Suck":
+            b = self._bit(k)
+            self.bits[b >> 3] &= ~(1 << (b & 7)) & 0xFF
+        elif action == "Right" and k < len(self.squares) - 1:
+            self.current = k + 1
+        elif action == "Left" and k > 0:
+            self.current = k - 1
+        elif action in ("Up", "Down"):
+            r, c = self.cell(k)
+            r += 1 if action == "Down" else -1
+            if 0 <= r < self.height:
+                self.current = self.index(r, c)
+
+    # ── performance measure ─────────────────────────────────────────────────
+    def dirty_count(self) -> int:
+        return int.from_bytes(self.bits, "little").bit_count()
+
+    def all_clean(self) -> bool:
+        return self.dirty_count() == 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Bit-packed 2D grid vacuum world")
+    parser.add_argument("--width", type=int, default=1000)
+    parser.add_argument("--height", type=int, default=1000)
+    parser.add_argument("--p-dirty", type=float, default=0.5)
+    parser.add_argument("--steps", type=int, default=None,
+                        help="default: 3 × squares (enough for one full sweep)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    n = args.width * args.height
+    steps = args.steps or 3 * n
+    for name, make in (("reflex", ReflexVacuumAgent), ("model", ModelBasedAgent)):
+        env = GridVacuumEnvironment(args.width, args.height, args.p_dirty, seed=args.seed)
+        before = env.dirty_count()
+        t0 = time.perf_counter()
+        result = run(env, make(env.squares), steps)
+        dt = time.perf_counter() - t0
+        print(f"{name:6} {args.width}×{args.height}: dirty {before} → {env.dirty_count()} "
+              f"| all clean: {env.all_clean()} | {steps / dt:,.0f} steps/s | score {result['score']}")
@@ -17,9 +17,14 @@ Policy overview:
     4. Else → "NoOp" (all clean).
 
 The helper `nearest_dirty()` makes the logic invariant to the number of squares.
+It asks `DirtyIndex`, a Fenwick tree over dirty squares kept in step with
+`model`, so each decision costs O(log N) instead of a scan over all squares.
 """
 
-from typing import List, Dict, Tuple, Optional
+import argparse
+from typing import Iterable, List, Dict, Tuple, Optional
+
+from trace_sinks import TextSink, add_sink_args, sink_from_args
 
 # ── CONFIG ─────────────────────────────────────────────────────────────────
 SQUARES: List[str] = ["A", "B", "C", "D"]  # <‑‑ Edit for different N / labels
@@ -60,16 +65,93 @@ def Actuators(action: str) -> None:
 
 # ── AGENT INTERNAL MODEL & POLICY ─────────────────────────────────────────
 
+class DirtyIndex:
+    """
+    Set of square indices the model believes dirty, as a Fenwick (binary
+    indexed) tree of 0/1 counts: mark, rank and nearest are all O(log N).
+    """
+
+    __slots__ = ("_n", "_bit", "_tree", "_count", "_top")
+
+    def __init__(self, size: int, indices: Iterable[int] = ()):
+        self._n = size
+        self._bit = bytearray(size)                 # 1 ⇔ dirty
+        for i in indices:
+            self._bit[i] = 1
+        tree = [0] * (size + 1)                     # O(N) bulk build
+        for i in range(1, size + 1):
+            tree[i] += self._bit[i - 1]
+            j = i + (i & -i)
+            if j <= size:
+                tree[j] += tree[i]
+        self._tree = tree
+        self._count = sum(self._bit)
+        self._top = 1 << (size.bit_length() - 1) if size else 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def mark(self, i: int, dirty: bool) -> None:
+        """Record square *i* as dirty/clean; no-op if already in that state."""
+        if self._bit[i] == dirty:
+            return
+        self._bit[i] = dirty
+        delta = 1 if dirty else -1
+        self._count += delta
+        tree, j = self._tree, i + 1
+        while j <= self._n:
+            tree[j] += delta
+            j += j & -j
+
+    def _rank(self, i: int) -> int:
+        """Number of dirty squares with index < *i*."""
+        tree, total = self._tree, 0
+        while i > 0:
+            total += tree[i]
+            i -= i & -i
+        return total
+
+    def _select(self, k: int) -> int:
+        """Index of the *k*-th dirty square (1-based k)."""
+        tree, pos, step = self._tree, 0, self._top
+        while step:
+            nxt = pos + step
+            if nxt <= self._n and tree[nxt] < k:
+                pos = nxt
+                k -= tree[nxt]
+            step >>= 1
+        return pos
+
+    def nearest(self, cur_idx: int) -> Optional[int]:
+        """Closest dirty index to *cur_idx*; lower index wins ties; None if empty."""
+        if self._bit[cur_idx]:
+            return cur_idx
+        below = self._rank(cur_idx)
+        left = self._select(below) if below else None
+        right = self._select(below + 1) if below < self._count else None
+        if left is None:
+            return right
+        if right is None or cur_idx - left <= right - cur_idx:
+            return left
+        return right
+
+
 # Start with an *unknown* (assumed DIRTY_INIT) model.
 model: Dict[str, str] = {loc: DIRTY_INIT for loc in SQUARES}
+dirty_index = DirtyIndex(len(SQUARES), (i for i, loc in enumerate(SQUARES) if model[loc] == "Dirty"))
+
+
+def reset_model() -> None:
+    """Forget everything: model back to DIRTY_INIT for every square."""
+    global dirty_index
+    for loc in SQUARES:
+        model[loc] = DIRTY_INIT
+    dirty_index = DirtyIndex(len(SQUARES), range(len(SQUARES)) if DIRTY_INIT == "Dirty" else ())
 
 
 def nearest_dirty(cur_idx: int) -> Optional[int]:
     """Return index of closest dirty square to *cur_idx*; None if all clean."""
-    dirty_indices = [i for i, loc in enumerate(SQUARES) if model[loc] == "Dirty"]
-    if not dirty_indices:
-        return None
-    return min(dirty_indices, key=lambda i: abs(i - cur_idx))
+    return dirty_index.nearest(cur_idx)
 
 
 def MODEL_BASED_AGENT(percept: Tuple[str, str]) -> str:
@@ -78,6 +160,7 @@ def MODEL_BASED_AGENT(percept: Tuple[str, str]) -> str:
 
     # 1) Update internal model with current percept.
     model[loc] = status
+    dirty_index.mark(INDEX[loc], status == "Dirty")
 
     # 2) If current square dirty ⇒ Suck.
     if status == "Dirty":
@@ -92,24 +175,31 @@ def MODEL_BASED_AGENT(percept: Tuple[str, str]) -> str:
     return "Right" if target_idx > idx else "Left"
 
 # ── SIMULATION DRIVER ─────────────────────────────────────────────────────
+ROW_WIDTHS = (8, 8, 6, 8, 8, 6)  # loc, status, act, new loc, new status, model dirty
+
 
-def run(steps: int = STEPS) -> None:
-    """Run agent *steps* iterations and print a compact trace."""
-    hdr = "Current                         New     ModelDirty?"
-    sub = "loc      status  act   loc      status  remaining"
-    print(hdr)
-    print(sub)
+def run(steps: int = STEPS, sink=None) -> None:
+    """Run agent *steps* iterations and write a compact trace to *sink* (default stdout)."""
+    sink = sink if sink is not None else TextSink(ROW_WIDTHS)
+    sink.header("Current                         New     ModelDirty?",
+                "loc      status  act   loc      status  remaining")
 
     for _ in range(steps):
         loc, st = Sensors()
-        dirty_left = sum(1 for s in model.values() if s == "Dirty")
-        print(f"{loc:8}{st:8}", end="")
-        act = MODEL_BASED_AGENT(Sensors())
+        dirty_left = len(dirty_index)
+        act = MODEL_BASED_AGENT((loc, st))
         Actuators(act)
         nloc, nst = Sensors()
-        print(f"{act:6}{nloc:8}{nst:8}{dirty_left:6}")
+        sink.row(loc, st, act, nloc, nst, dirty_left)
+    sink.flush()
 
 
 # ── ENTRYPOINT ────────────────────────────────────────────────────────
 if __name__ == "__main__":
-    run()
+    parser = argparse.ArgumentParser(description="N-square model-based reflex vacuum agent")
+    parser.add_argument("--steps", type=int, default=STEPS)
+    add_sink_args(parser)
+    args = parser.parse_args()
+    sink = sink_from_args(args, ROW_WIDTHS, SQUARES)
+    run(args.steps, sink)
+    sink.close()
@@ -14,8 +14,11 @@ automatically derived from those parameters – no other lines need
 editing.
 """
 
+import argparse
 from typing import List, Dict, Tuple
 
+from trace_sinks import TextSink, add_sink_args, sink_from_args
+
 # ── CONFIG ─────────────────────────────────────────────────────────────────
 SQUARES: List[str] = ["A", "B", "C", "D"]  # <<< change here for different N
 DIRTY_INIT: str = "Dirty"                  # default starting dirt status
@@ -65,23 +68,30 @@ def REFLEX_VACUUM_AGENT(percept: Tuple[str, str]) -> str:
     return "Right" if idx < len(SQUARES) - 1 else "Left"
 
 # ── SIMULATION DRIVER ─────────────────────────────────────────────────────
+ROW_WIDTHS = (8, 8, 6, 8, 8)  # loc, status, act, new loc, new status
+
 
-def run(steps: int = STEPS) -> None:
-    """Run agent *steps* iterations and print a compact trace."""
-    hdr = "Current                         New"
-    sub = "loc      status  act   loc      status"
-    print(hdr)
-    print(sub)
+def run(steps: int = STEPS, sink=None) -> None:
+    """Run agent *steps* iterations and write a compact trace to *sink* (default stdout)."""
+    sink = sink if sink is not None else TextSink(ROW_WIDTHS)
+    sink.header("Current                         New",
+                "loc      status  act   loc      status")
 
     for _ in range(steps):
         loc, st = Sensors()
-        print(f"{loc:8}{st:8}", end="")
-        act = REFLEX_VACUUM_AGENT(Sensors())
+        act = REFLEX_VACUUM_AGENT((loc, st))
         Actuators(act)
         nloc, nst = Sensors()
-        print(f"{act:6}{nloc:8}{nst:8}")
+        sink.row(loc, st, act, nloc, nst)
+    sink.flush()
 
 
 # ── ENTRYPOINT ────────────────────────────────────────────────────────
 if __name__ == "__main__":
-    run()
+    parser = argparse.ArgumentParser(description="N-square simple reflex vacuum agent")
+    parser.add_argument("--steps", type=int, default=STEPS)
+    add_sink_args(parser)
+    args = parser.parse_args()
+    sink = sink_from_args(args, ROW_WIDTHS, SQUARES)
+    run(args.steps, sink)
+    sink.close()
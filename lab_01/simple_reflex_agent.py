@@ -6,7 +6,19 @@ Takeaways
 • *Simple‑reflex* ⇒ decision uses **current percept only** -> O(1) memory
 • Condition‑action **rules table** replaces huge percept table
 • Actuator layer = **safety filter** -> ignores illegal / bogus actions
+• `compile_rules()` flattens rules + RULE_ACTION into one dense table indexed
+  by interned (location, status) ids and vets every action against
+  VALID_ACTIONS **once** -> `decide()` is a single list index,
+  `decide_batch()` decides thousands of percepts in one NumPy gather
 """
+import argparse
+
+from trace_sinks import TextSink, add_sink_args, sink_from_args
+
+try:
+    import numpy as np
+except ImportError:
+    np = None  # decide_batch() needs NumPy; everything else runs without it
 
 # ── world constants ───────────────────────────────────────────────────────────
 A, B = 'A', 'B'                   # 2‑location vacuum world
@@ -57,6 +69,68 @@ def SIMPLE_REFLEX_AGENT(percept):
     rule = RULE_MATCH(state)                 # ② pick rule
     return RULE_ACTION.get(rule, 'NoOp')     # ③ map to action
 
+# ── compiled rule base ───────────────────────────────────────────────────────
+
+class CompiledRules:
+    """Dense decision table: action_id = table[loc_id * n_status + status_id]."""
+
+    __slots__ = ("loc_ids", "status_ids", "actions", "table", "rejected", "unreachable")
+
+    def decide(self, percept):
+        """Action for *percept*; 'NoOp' for one the table was not compiled for."""
+        loc, status = percept
+        try:
+            return self.actions[self.table[self.loc_ids[loc] * len(self.status_ids)
+                                           + self.status_ids[status]]]
+        except KeyError:
+            return 'NoOp'                    # same default as SIMPLE_REFLEX_AGENT
+
+    def decide_batch(self, percepts_array):
+        """(n, 2) int array of (loc_id, status_id) -> (n,) array of action ids."""
+        if np is None:
+            raise RuntimeError("decide_batch() requires NumPy")
+        p = np.asarray(percepts_array)
+        return np.asarray(self.table, dtype=np.uint8)[p[:, 0] * len(self.status_ids) + p[:, 1]]
+
+
+def compile_rules(rules, rule_action, valid_actions=VALID_ACTIONS,
+                  locations=(A, B), statuses=('Clean', 'Dirty'), strict=False):
+    """
+    Intern locations/statuses to small ints and resolve condition -> rule -> action
+    into one table.  Actions outside *valid_actions* become 'NoOp' (id 0) and are
+    listed in `rejected`; conditions that are not a (location, status) percept
+    can never fire and are listed in `unreachable`.  *strict* raises instead.
+    """
+    c = CompiledRules()
+    c.loc_ids = {loc: i for i, loc in enumerate(locations)}
+    c.status_ids = {st: i for i, st in enumerate(statuses)}
+    c.actions = ['NoOp'] + sorted(valid_actions)
+    action_ids = {a: i for i, a in enumerate(c.actions)}
+    c.table = [0] * (len(locations) * len(statuses))
+    c.rejected, c.unreachable = [], []
+
+    for cond, rule in rules.items():
+        action = rule_action.get(rule, 'NoOp')
+        if len(cond) != 2 or cond[0] not in c.loc_ids or cond[1] not in c.status_ids:
+            c.unreachable.append((cond, action))
+            continue
+        if action not in action_ids:
+            c.rejected.append((cond, action))
+            action = 'NoOp'
+        loc, status = cond
+        c.table[c.loc_ids[loc] * len(statuses) + c.status_ids[status]] = action_ids[action]
+
+    if strict and (c.rejected or c.unreachable):
+        raise ValueError(f"invalid rules: rejected={c.rejected} unreachable={c.unreachable}")
+    return c
+
+
+COMPILED = compile_rules(rules, RULE_ACTION)
+
+
+def COMPILED_REFLEX_AGENT(percept):
+    return COMPILED.decide(percept)          # one table index, no string compares
+
 # ── sensors & actuators ──────────────────────────────────────────────────────
 
 def Sensors():
@@ -79,20 +153,38 @@ def Actuators(action):
     # Any illegal move combination is ignored (additional safeguard)
 
 # ── simulation driver ────────────────────────────────────────────────────────
+ROW_WIDTHS = (12, 8, 8, 12, 8)   # location, status, action, location, status
+
 
-def run(steps: int = 10):
-    """Run agent *steps* iterations and print trace."""
-    print('    Current                        New')
-    print('location    status  action  location    status')
+def run(steps: int = 10, sink=None, agent=SIMPLE_REFLEX_AGENT):
+    """Run *agent* for *steps* iterations and write trace to *sink* (default stdout)."""
+    sink = sink if sink is not None else TextSink(ROW_WIDTHS)
+    sink.header('    Current                        New',
+                'location    status  action  location    status')
 
     for _ in range(steps):
         (loc, st) = Sensors()
-        print(f'{loc:12}{st:8}', end='')
-        act = SIMPLE_REFLEX_AGENT(Sensors())  # choose action
+        act = agent((loc, st))               # choose action
         Actuators(act)
         (new_loc, new_st) = Sensors()
-        print(f'{act:8}{new_loc:12}{new_st:8}')
+        sink.row(loc, st, act, new_loc, new_st)
+    sink.flush()
 
 # ── demo (exercise expects run(10)) ──────────────────────────────────────────
 if __name__ == '__main__':
-    run(10)
\ No newline at end of file
+    parser = argparse.ArgumentParser(description='Simple reflex agent (dictionary rules)')
+    parser.add_argument('--steps', type=int, default=10)
+    parser.add_argument('--compiled', action='store_true', help='use COMPILED_REFLEX_AGENT')
+    add_sink_args(parser)
+    args = parser.parse_args()
+    sink = sink_from_args(args, ROW_WIDTHS, [A, B])
+    run(args.steps, sink, COMPILED_REFLEX_AGENT if args.compiled else SIMPLE_REFLEX_AGENT)
+
+    if args.compiled:
+        # compile report goes through the sink ⇒ text only, silent for null / bin
+        table = dict(zip([(loc, st) for loc in COMPILED.loc_ids for st in COMPILED.status_ids],
+                         [COMPILED.actions[i] for i in COMPILED.table]))
+        sink.header('', f'Compiled rule table: {table}',
+                    f'Rejected (invalid action -> NoOp): {COMPILED.rejected}',
+                    f'Unreachable (not a percept): {COMPILED.unreachable}')
+    sink.close()
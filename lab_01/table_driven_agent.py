@@ -11,7 +11,18 @@ Lab-01 ▸ Exercise 1  ▸ Table-Driven Vacuum Agent
   - Branching factor here is 4 (A/B × Clean/Dirty).
 
   - Missing entry ⇒ agent returns None (shows table is incomplete).
+
+  - `PerceptTrie` stores the same table as a prefix tree of percepts; the
+    agent keeps a cursor and follows one edge per percept ⇒ O(1) per step,
+    no history tuple copied or hashed (TABLE_DRIVEN_AGENT is O(T) per step).
+
+  - `LazyActionTable` never materialises the 4**T entries: it keys on the
+    last k percepts only (≤ 4**k keys, k = 1 is Q3's 4-entry table), computes
+    a missing entry from a policy on demand and keeps it in a bounded LRU
+    cache ⇒ fixed memory ceiling for any lifetime T, and repeats hit.
 """
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional, Tuple
 
 # --- constants --------------------------------------------------------------- #
 A, B = 'A', 'B'               # ► 2-square world (exam: deterministic env.)
@@ -41,6 +52,149 @@ def TABLE_DRIVEN_AGENT(percept):
     percepts.append(percept)            # 1 ▸ accumulate history
     return LOOKUP(percepts, table)      # 2 ▸ pick action from table
 
+# --- trie-backed table -------------------------------------------------------- #
+class PerceptTrie:
+    """
+    Action table as a prefix tree.  Node 0 = empty history; each edge is one
+    percept, so a history of length T is a path of T edges.
+
+    *max_nodes* bounds memory: entries that would need more nodes are skipped
+    (counted in `dropped`) and later look up as missing ⇒ None.
+    """
+
+    __slots__ = ("edges", "actions", "max_nodes", "dropped")
+
+    ROOT = 0
+
+    def __init__(self, max_nodes: Optional[int] = None):
+        self.edges: Dict[Tuple[int, tuple], int] = {}   # (node, percept) -> child
+        self.actions: List[Optional[str]] = [None]      # node -> action
+        self.max_nodes = max_nodes
+        self.dropped = 0
+
+    def __len__(self):
+        return len(self.actions)
+
+    def add(self, history, action) -> bool:
+        """Insert *history* → *action*; False if the node budget forbids it."""
+        node, path = self.ROOT, list(history)
+        for depth, percept in enumerate(path):
+            nxt = self.edges.get((node, percept))
+            if nxt is None:
+                missing = len(path) - depth
+                if self.max_nodes is not None and len(self.actions) + missing > self.max_nodes:
+                    self.dropped += 1
+                    return False
+                for p in path[depth:]:                  # grow the remaining chain
+                    self.edges[(node, p)] = node = len(self.actions)
+                    self.actions.append(None)
+                break
+            node = nxt
+        self.actions[node] = action
+        return True
+
+    def step(self, node: Optional[int], percept) -> Optional[int]:
+        """Follow one edge; None once the history has left the table."""
+        return None if node is None else self.edges.get((node, percept))
+
+    def action(self, node: Optional[int]) -> Optional[str]:
+        return None if node is None else self.actions[node]
+
+    @classmethod
+    def from_table(cls, tbl, max_nodes: Optional[int] = None) -> "PerceptTrie":
+        """Build from a `{percept-history tuple: action}` dict (shortest first)."""
+        trie = cls(max_nodes)
+        for history in sorted(tbl, key=len):
+            trie.add(history, tbl[history])
+        return trie
+
+    @classmethod
+    def from_run(cls, run) -> "PerceptTrie":
+        """Chain covering one lifetime: *run* yields (percept, action) pairs; O(T)."""
+        trie, node = cls(), cls.ROOT
+        for percept, action in run:
+            trie.edges[(node, percept)] = node = len(trie.actions)
+            trie.actions.append(action)
+        return trie
+
+
+trie = PerceptTrie.from_table(table)
+cursor: Optional[int] = PerceptTrie.ROOT   # ► replaces the history list
+
+
+def TRIE_DRIVEN_AGENT(percept):
+    """Same answers as TABLE_DRIVEN_AGENT, one trie edge per call."""
+    global cursor
+    cursor = trie.step(cursor, percept)     # 1 ▸ advance cursor
+    return trie.action(cursor)              # 2 ▸ action stored at that node
+
+# --- lazily materialised table ---------------------------------------------- #
+class LazyActionTable:
+    """
+    Action table keyed by the last *window* percepts (shorter at the start of
+    a life), filled on demand.  A miss asks *policy(percept)* for the action
+    (the newest percept is what a reflex policy needs); entries live in an
+    LRU cache of at most *maxsize* keys.  A key is the whole bounded history,
+    so evicting one never orphans another, and the same suffix recurs
+    whenever the world revisits a situation ⇒ hits.  Same `step` / `action`
+    interface as `PerceptTrie`, with the suffix tuple as the cursor.
+
+    Seed entries from *tbl* longer than *window* cannot be keyed and are
+    skipped; the others answer both their exact history and, at full
+    length, every history ending in it.
+    """
+
+    __slots__ = ("policy", "maxsize", "window", "_actions", "hits", "misses", "evictions")
+
+    ROOT: tuple = ()
+
+    def __init__(self, policy: Callable[[tuple], Optional[str]], maxsize: int = 4096,
+                 tbl=None, window: int = 2):
+        if maxsize < 1 or window < 1:                  # 0 ⇒ no cache / whole history as key
+            raise ValueError(f"maxsize and window must be >= 1 (got {maxsize}, {window})")
+        self.policy, self.maxsize, self.window = policy, maxsize, window
+        self._actions: "OrderedDict[tuple, Optional[str]]" = OrderedDict()
+        self.hits = self.misses = self.evictions = 0
+        for history in sorted(tbl or (), key=len):     # optional static seed
+            if len(history) <= window:
+                self._insert(tuple(history), tbl[history])
+
+    def __len__(self):
+        return len(self._actions)
+
+    def _insert(self, key: tuple, action) -> None:
+        if len(self._actions) >= self.maxsize:
+            self._actions.popitem(last=False)
+            self.evictions += 1
+        self._actions[key] = action
+
+    def step(self, node: tuple, percept) -> tuple:
+        """Slide the window by *percept* and make sure its entry is cached; O(window)."""
+        key = (node + (percept,))[-self.window:]
+        if key in self._actions:
+            self.hits += 1
+            self._actions.move_to_end(key)
+        else:
+            self.misses += 1
+            self._insert(key, self.policy(percept))
+        return key
+
+    def action(self, node: tuple) -> Optional[str]:
+        return self._actions.get(node)
+
+    def stats(self) -> Dict[str, float]:
+        looked_up = self.hits + self.misses
+        return {"size": len(self._actions), "hits": self.hits, "misses": self.misses,
+                "evictions": self.evictions, "hit_rate": self.hits / looked_up if looked_up else 0.0}
+
+
+def REFLEX_POLICY(percept):
+    """Reflex rule that fills lazy-table misses (agrees with `table` above)."""
+    location, status = percept
+    if status == 'Dirty':
+        return 'Suck'
+    return 'Right' if location == A else 'Left'
+
 # --- helpers for Q3 & Q4 ----------------------------------------------------- #
 def min_entries_single_percept():
     """For |Locations|=2, |Status|=2 ⇒ branching = 4."""
@@ -61,6 +215,21 @@ def run_demo():
     print(TABLE_DRIVEN_AGENT((B, 'Clean')), "\t", percepts,
           "  <-- None because 4-length history missing")
 
+    # Trie-backed agent replays the same percepts without keeping history
+    print("\nTrie agent (", len(trie), "nodes ):",
+          [TRIE_DRIVEN_AGENT(p) for p in percepts])
+
+    # Lazy table: long lifetime, fixed memory ceiling, repeated suffixes hit
+    import random
+    rng = random.Random(0)
+    T = 10 ** 5
+    for window, maxsize in ((2, 1024), (3, 16)):
+        lazy, node = LazyActionTable(REFLEX_POLICY, maxsize, table, window), LazyActionTable.ROOT
+        for _ in range(T):
+            node = lazy.step(node, (rng.choice((A, B)), rng.choice(('Clean', 'Dirty'))))
+        print(f"Lazy table (k={window}, max {maxsize}) after T={T} steps:", lazy.stats(),
+              "last action:", lazy.action(node))
+
     # Q3 & Q4 numeric answers
     print("\nQ3 -> entries if only current percept used:\t", min_entries_single_percept())
     T = 4
@@ -0,0 +1,134 @@
+"""
+Lab 01 ▸ Trace Sinks for the agent simulations
+==============================================
+`run()` hands every trace row to a *sink* instead of printing it directly.
+
+Takeaways:
+    • `NullSink`   – drops everything ⇒ benchmarks measure the agent, not I/O.
+    • `TextSink`   – formats rows with fixed column widths and writes them in
+                     batches (one `write()` per *batch* rows) ⇒ same text as
+                     the old per-step `print`.
+    • `BinarySink` – fixed-width little-endian records (`RECORD_DTYPE`), written
+                     in batches; `load_trace()` memory-maps the file with NumPy.
+    • `add_sink_args()` / `sink_from_args()` give every lab script the same CLI:
+          --sink {text,null,bin}  --out FILE  --batch N
+"""
+
+import argparse
+import struct
+import sys
+from typing import IO, List, Optional, Sequence
+
+# ── binary record layout ────────────────────────────────────────────────────
+#   loc u4 | status u1 | action u1 | new_loc u4 | new_status u1 | extra i4
+RECORD = struct.Struct("<IBBIBi")
+RECORD_DTYPE = [("loc", "<u4"), ("status", "u1"), ("action", "u1"),
+                ("new_loc", "<u4"), ("new_status", "u1"), ("extra", "<i4")]
+STATUS_CODES = {"Clean": 0, "Dirty": 1}
+ACTION_CODES = {"Suck": 0, "Left": 1, "Right": 2, "NoOp": 3}
+OTHER_ACTION = 255  # bogus / unknown actions (e.g. 'Crash'), None
+
+
+class NullSink:
+    """Discard every row."""
+
+    def header(self, *lines: str) -> None:
+        pass
+
+    def row(self, *fields) -> None:
+        pass
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+
+class TextSink(NullSink):
+    """Fixed-width text rows, buffered and written *batch* rows at a time."""
+
+    def __init__(self, widths: Sequence[int], stream: Optional[IO[str]] = None, batch: int = 1024):
+        self.fmt = "".join(f"{{:{w}}}" for w in widths) + "\n"
+        self.stream = stream if stream is not None else sys.stdout
+        self.batch = batch
+        self._buf: List[str] = []
+
+    def header(self, *lines: str) -> None:
+        self._buf.extend(line + "\n" for line in lines)
+
+    def row(self, *fields) -> None:
+        self._buf.append(self.fmt.format(*fields))
+        if len(self._buf) >= self.batch:
+            self.flush()
+
+    def flush(self) -> None:
+        if self._buf:
+            self.stream.write("".join(self._buf))
+            self._buf.clear()
+        self.stream.flush()
+
+    def close(self) -> None:
+        self.flush()
+        if self.stream not in (sys.stdout, sys.stderr):
+            self.stream.close()
+
+
+class BinarySink(NullSink):
+    """
+    Packed `RECORD` per row; locations are stored as their index in *squares*.
+    Rows have the shape (loc, status, action, new_loc, new_status[, extra]).
+    """
+
+    def __init__(self, path: str, squares: Sequence, batch: int = 4096):
+        self.file = open(path, "wb")
+        self.index = {loc: i for i, loc in enumerate(squares)}
+        self.batch = batch
+        self._buf = bytearray()
+        self._n = 0
+
+    def row(self, loc, status, action, new_loc, new_status, extra: int = -1) -> None:
+        self._buf += RECORD.pack(self.index[loc], STATUS_CODES[status],
+                                 ACTION_CODES.get(action, OTHER_ACTION),
+                                 self.index[new_loc], STATUS_CODES[new_status], extra)
+        self._n += 1
+        if self._n >= self.batch:
+            self.flush()
+
+    def flush(self) -> None:
+        if self._buf:
+            self.file.write(self._buf)
+            self._buf.clear()
+            self._n = 0
+        self.file.flush()
+
+    def close(self) -> None:
+        self.flush()
+        self.file.close()
+
+
+def load_trace(path: str):
+    """Memory-map a `BinarySink` file as a NumPy structured array."""
+    import numpy as np
+    return np.memmap(path, dtype=np.dtype(RECORD_DTYPE), mode="r")
+
+# ── CLI helpers ─────────────────────────────────────────────────────────────
+
+def add_sink_args(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--sink", choices=("text", "null", "bin"), default="text",
+                        help="trace output: text (default), null, or bin records")
+    parser.add_argument("--out", default=None,
+                        help="output file (default stdout for text; required for bin)")
+    parser.add_argument("--batch", type=int, default=1024, help="rows per buffered write")
+
+
+def sink_from_args(args: argparse.Namespace, widths: Sequence[int], squares: Sequence):
+    """Build the sink selected on the command line."""
+    if args.sink == "null":
+        return NullSink()
+    if args.sink == "bin":
+        if not args.out:
+            raise SystemExit("--sink bin needs --out FILE")
+        return BinarySink(args.out, squares, args.batch)
+    stream = open(args.out, "w") if args.out else None
+    return TextSink(widths, stream, args.batch)
@@ -0,0 +1,255 @@
+"""
+Lab 01 ▸ Instance-Scoped Vacuum World (Environment / Agent objects)
+===================================================================
+The lab scripts keep their world and agent memory in module globals
+(`Environment`, `model`, `percepts`), so only one simulation can live in a
+process.  Here every piece of state belongs to an object instead.
+
+Takeaways:
+    • `VacuumEnvironment` = one N-square linear world (`sensors` / `actuators`).
+    • Agents are callables `agent(percept) -> action` with their own memory:
+        – `ReflexVacuumAgent`  (homework 1 policy, no memory)
+        – `ModelBasedAgent`    (homework 2 policy, internal model)
+        – `SimpleReflexAgent`  (exercise 3 rule base)
+        – `TableDrivenAgent`   (exercise 1 percept-history table; static trie
+                                 or lazily filled LRU `LazyActionTable`)
+    • All classes use `__slots__` ⇒ no per-instance `__dict__`, cheap to create.
+    • `run_many(configs, workers=N)` farms independent simulations out to a
+      process pool and returns results in input order.
+
+Run:
+    python vacuum_world.py                  # sweep a small grid of configs
+    python vacuum_world.py --workers 8 --max-squares 64
+"""
+
+import argparse
+import itertools
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from reflex_agent_with_state import DirtyIndex
+from table_driven_agent import LazyActionTable, PerceptTrie
+
+Percept = Tuple[Any, str]
+Config = Dict[str, Any]
+
+VALID_ACTIONS = frozenset({"Suck", "Left", "Right", "NoOp"})
+
+# ── ENVIRONMENT ─────────────────────────────────────────────────────────────
+
+class VacuumEnvironment:
+    """N-square linear world; squares are addressed by label, stored by index."""
+
+    __slots__ = ("squares", "index", "status", "current", "valid_actions")
+
+    def __init__(self,
+                 squares: Sequence[Any],
+                 dirty_init: str = "Dirty",
+                 start: Any = None,
+                 dirt: Optional[Sequence[str]] = None,
+                 valid_actions: Iterable[str] = VALID_ACTIONS):
+        self.squares = list(squares)
+        self.index = {loc: i for i, loc in enumerate(self.squares)}
+        self.status = list(dirt) if dirt is not None else [dirty_init] * len(self.squares)
+        self.current = 0 if start is None else self.index[start]
+        self.valid_actions = frozenset(valid_actions)
+
+    def sensors(self) -> Percept:
+        """Return (location, status)."""
+        return self.squares[self.current], self.status[self.current]
+
+    def actuators(self, action: str) -> None:
+        """Safely mutate world for **valid** actions; ignore anything else."""
+        if action not in self.valid_actions:
+            return
+        idx = self.current
+        if action == "Suck":
+            self.status[idx] = "Clean"
+        elif action == "Right" and idx < len(self.squares) - 1:
+            self.current = idx + 1
+        elif action == "Left" and idx > 0:
+            self.current = idx - 1
+
+    def dirty_count(self) -> int:
+        return self.status.count("Dirty")
+
+# ── AGENTS ──────────────────────────────────────────────────────────────────
+
+def _index_of(squares: Sequence[Any]):
+    """Label → index lookup; `range(n)` labels are their own index (no dict)."""
+    if isinstance(squares, range) and squares.start == 0 and squares.step == 1:
+        return squares
+    return {loc: i for i, loc in enumerate(squares)}
+
+
+class ReflexVacuumAgent:
+    """Homework 1 policy: Suck if dirty, else Right until the last square."""
+
+    __slots__ = ("index", "last")
+
+    def __init__(self, squares: Sequence[Any]):
+        self.index = _index_of(squares)
+        self.last = len(squares) - 1
+
+    def __call__(self, percept: Percept) -> str:
+        loc, status = percept
+        if status == "Dirty":
+            return "Suck"
+        return "Right" if self.index[loc] < self.last else "Left"
+
+
+class ModelBasedAgent:
+    """Homework 2 policy: internal model, walk toward the nearest dirty square."""
+
+    __slots__ = ("index", "model", "dirty")
+
+    def __init__(self, squares: Sequence[Any], dirty_init: str = "Dirty"):
+        self.index = _index_of(squares)
+        self.model = [dirty_init] * len(squares)
+        self.dirty = DirtyIndex(len(squares), range(len(squares)) if dirty_init == "Dirty" else ())
+
+    def nearest_dirty(self, cur_idx: int) -> Optional[int]:
+        """Return index of closest dirty square to *cur_idx*; None if all clean."""
+        return self.dirty.nearest(cur_idx)
+
+    def __call__(self, percept: Percept) -> str:
+        loc, status = percept
+        idx = self.index[loc]
+        self.model[idx] = status
+        self.dirty.mark(idx, status == "Dirty")
+        if status == "Dirty":
+            return "Suck"
+        target_idx = self.nearest_dirty(idx)
+        if target_idx is None:
+            return "NoOp"
+        return "Right" if target_idx > idx else "Left"
+
+
+class SimpleReflexAgent:
+    """Exercise 3: condition-action rules, then rule-id → action."""
+
+    __slots__ = ("rules", "rule_action")
+
+    def __init__(self, rules: Dict[tuple, int], rule_action: Dict[int, str]):
+        self.rules, self.rule_action = rules, rule_action
+
+    def __call__(self, percept: Percept) -> str:
+        return self.rule_action.get(self.rules.get(tuple(percept)), "NoOp")
+
+
+class TableDrivenAgent:
+    """Exercise 1: percept-history table, walked as a trie with a cursor."""
+
+    __slots__ = ("trie", "cursor")
+
+    def __init__(self, table: Union[Dict[tuple, str], PerceptTrie, LazyActionTable]):
+        self.trie = table if hasattr(table, "step") else PerceptTrie.from_table(table)
+        self.cursor = self.trie.ROOT
+
+    def __call__(self, percept: Percept) -> Optional[str]:
+        self.cursor = self.trie.step(self.cursor, percept)
+        return self.trie.action(self.cursor)
+
+# ── SIMULATION ──────────────────────────────────────────────────────────────
+
+def run(env: VacuumEnvironment, agent, steps: int, trace: bool = False) -> Dict[str, Any]:
+    """
+    Run *agent* in *env* for *steps* iterations.
+
+    Returns score (+1 per clean square per step), dirty squares left, and – when
+    *trace* – the list of (loc, status, action, new_loc, new_status) rows that
+    the lab scripts print.
+    """
+    n = len(env.squares)
+    dirty_left = env.dirty_count()
+    score = 0
+    rows: List[tuple] = []
+    for _ in range(steps):
+        loc, st = env.sensors()
+        act = agent((loc, st))
+        env.actuators(act)
+        if act == "Suck" and st == "Dirty":
+            dirty_left -= 1
+        score += n - dirty_left
+        if trace:
+            rows.append((loc, st, act, *env.sensors()))
+    result: Dict[str, Any] = {"score": score, "dirty_left": dirty_left}
+    if trace:
+        result["trace"] = rows
+    return result
+
+
+def make_agent(kind: str, squares: Sequence[Any], dirty_init: str = "Dirty"):
+    """Build a fresh agent by name (`reflex`, `model`, `rules`, `table`, `lazy`)."""
+    if kind == "reflex":
+        return ReflexVacuumAgent(squares)
+    if kind == "model":
+        return ModelBasedAgent(squares, dirty_init)
+    if kind == "rules":
+        from simple_reflex_agent import RULE_ACTION, rules
+        return SimpleReflexAgent(rules, RULE_ACTION)
+    if kind == "table":
+        from table_driven_agent import trie
+        return TableDrivenAgent(trie)
+    if kind == "lazy":
+        return TableDrivenAgent(LazyActionTable(ReflexVacuumAgent(squares)))
+    raise ValueError(f"unknown agent kind: {kind!r}")
+
+
+def run_config(config: Config) -> Dict[str, Any]:
+    """
+    Run one simulation described by a plain dict (picklable ⇒ pool-friendly).
+
+    Keys: `squares` (list or int N ⇒ labels 0…N-1), `dirty_init`, `dirt`,
+    `start`, `steps`, `agent`, `trace`.  The result echoes the config.
+    """
+    squares = config.get("squares", ["A", "B", "C", "D"])
+    if isinstance(squares, int):
+        squares = list(range(squares))
+    dirty_init = config.get("dirty_init", "Dirty")
+    env = VacuumEnvironment(squares, dirty_init, config.get("start"), config.get("dirt"))
+    agent = make_agent(config.get("agent", "reflex"), squares, dirty_init)
+    result = run(env, agent, config.get("steps", 20), config.get("trace", False))
+    result["config"] = config
+    return result
+
+
+def run_many(configs: Iterable[Config],
+             workers: Optional[int] = None,
+             chunksize: int = 64) -> List[Dict[str, Any]]:
+    """
+    Run every config and gather results in input order.
+
+    *workers* = 1 runs in-process; otherwise a `ProcessPoolExecutor` with
+    *workers* processes (None ⇒ one per CPU core).
+    """
+    configs = list(configs)
+    if workers == 1:
+        return [run_config(c) for c in configs]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(run_config, configs, chunksize=chunksize))
+
+# ── DEMO: configuration sweep ──────────────────────────────────────────────
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Parallel vacuum-world configuration sweep")
+    parser.add_argument("--workers", type=int, default=None, help="processes (default: all cores)")
+    parser.add_argument("--max-squares", type=int, default=32, help="largest world size in the sweep")
+    parser.add_argument("--steps", type=int, default=200)
+    args = parser.parse_args()
+
+    sizes = range(2, args.max_squares + 1)
+    configs = [
+        {"squares": n, "dirty_init": dirty, "start": start, "steps": args.steps, "agent": kind}
+        for n, dirty, kind in itertools.product(sizes, ("Dirty", "Clean"), ("reflex", "model"))
+        for start in range(n)
+    ]
+
+    t0 = time.perf_counter()
+    results = run_many(configs, workers=args.workers)
+    dt = time.perf_counter() - t0
+    print(f"{len(results)} simulations in {dt:.2f}s")
+
+    for kind in ("reflex", "model"):
+        scores = [r["score"] for r in results if r["config"]["agent"] == kind]
+        print(f"  {kind:6} mean score {sum(scores) / len(scores):8.1f}")
@@ -0,0 +1,56 @@
+"""
+Lab 02 ▸ Benchmark — bfs() vs bidirectional_bfs() on scaled-up river crossings
+==============================================================================
+Puzzle of size n = Farmer, Wolf, Goat, Cabbage + (n-4) inert items, everyone
+starting West.  Reachable states grow like 2**n; the solution depth grows
+linearly, so meeting in the middle visits far fewer states.
+
+Expansions are counted by wrapping `homework.successor_fn` (both searches
+call it once per expanded state).
+
+Run:
+    python bench_bidirectional.py
+    python bench_bidirectional.py --sizes 8 12 16 20
+"""
+
+import argparse
+import time
+
+import homework
+
+
+def scaled_puzzle(n: int) -> None:
+    entities = ("Farmer", "Wolf", "Goat", "Cabbage") + tuple(f"Item{i}" for i in range(n - 4))
+    homework.configure(entities, ("W",) * n, ("E",) * n, [(1, 2), (2, 3)])
+
+
+def measure(search):
+    calls = 0
+    inner = homework.successor_fn
+
+    def counting(state):
+        nonlocal calls
+        calls += 1
+        return inner(state)
+
+    homework.successor_fn = counting
+    try:
+        t0 = time.perf_counter()
+        path = search()
+        return path, calls, time.perf_counter() - t0
+    finally:
+        homework.successor_fn = inner
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="bfs vs bidirectional_bfs")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[6, 8, 10, 12, 14, 16])
+    args = parser.parse_args()
+
+    print(f"{'n':>3} {'moves':>6} {'bfs exp':>10} {'bfs s':>8} {'bi exp':>10} {'bi s':>8} {'speed-up':>9}")
+    for n in args.sizes:
+        scaled_puzzle(n)
+        p1, e1, t1 = measure(homework.bfs)
+        p2, e2, t2 = measure(homework.bidirectional_bfs)
+        assert len(p1) == len(p2), "bidirectional path is not shortest"
+        print(f"{n:3} {len(p1) - 1:6} {e1:10} {t1:8.3f} {e2:10} {t2:8.3f} {t1 / t2:8.1f}×")
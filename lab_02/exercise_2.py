@@ -2,65 +2,130 @@
 Lab 02 ▸ Exercise 2 — Vacuum-World via Breadth-First Search
 ==========================================================
 Takeaways:
-    • State = (location, A-status, B-status)
+    • State = (location, dirt bitmask) packed into one int:
+          state = location << N | dirt        (bit i set ⇔ square i dirty)
+      printed as the familiar ('A', 'Dirty', 'Dirty') tuples.
     • Breadth-First Search ⇒ guarantees **shortest action sequence** (optimal cost = # of moves)
-    • Explored-set prevents revisiting states |V| ≤ 8  (2 locs × 2^2 dirt configs)
-    • Successor fn embodies env. physics:  Suck / Move / NoOp
+    • Successor fn embodies env. physics:  Suck / Left / Right – a *generator*,
+      so only states BFS actually reaches are ever built (no STATE_SPACE table).
+    • Explored-set = bytearray bitmap over N·2^N codes ⇒ 1 bit per state
+      (N = 20: 2·10⁷ states in 2.5 MB).
+    • `Node` uses `__slots__` ⇒ no per-instance `__dict__`.
+    • Fringe = `fringe.FIFOFringe` (deque) ⇒ O(1) enqueue / dequeue
+
+Run:
+    python exercise_2.py                      # 2 squares, step trace
+    python exercise_2.py --squares 12 --quiet
 """
+import string
+
+from fringe import FIFOFringe
+from search_hooks import CounterObserver, StepTraceObserver
+
+# --- state-space (generated) ------------------------------------------------- #
+SQUARES = 2
+ALL_DIRTY = 0b11
+INITIAL_STATE = 0          # set by configure()
+GOAL_STATE = 0
+
+
+def label(i):
+    return string.ascii_uppercase[i] if SQUARES <= 26 else f"S{i}"
+
+
+def encode(pos, dirt):
+    return pos << SQUARES | dirt
+
 
-# --- state-space ------------------------------------------------------------- #
-# 8 reachable states in 2-square world.
-STATE_SPACE = {
-    ('A', 'Dirty', 'Dirty'): [ ('A', 'Clean', 'Dirty'), ('B', 'Dirty', 'Dirty') ],
-    ('A', 'Clean', 'Dirty'): [ ('B', 'Clean', 'Dirty') ],
-    ('A', 'Dirty', 'Clean'): [ ('A', 'Clean', 'Clean'), ('B', 'Dirty', 'Clean') ],
-    ('A', 'Clean', 'Clean'): [ ('B', 'Clean', 'Clean') ],                       # goal on A
-    ('B', 'Dirty', 'Dirty'): [ ('B', 'Dirty', 'Clean'), ('A', 'Dirty', 'Dirty') ],
-    ('B', 'Clean', 'Dirty'): [ ('B', 'Clean', 'Clean'), ('A', 'Clean', 'Dirty') ],
-    ('B', 'Dirty', 'Clean'): [ ('B', 'Clean', 'Clean'), ('A', 'Dirty', 'Clean') ],
-    ('B', 'Clean', 'Clean'): []                                                 # goal on B
-}
-
-INITIAL_STATE = ('B', 'Dirty', 'Dirty')
-GOAL_STATE    = ('A', 'Clean', 'Clean')
+def decode(state):
+    """int → ('A', 'Clean', 'Dirty', …) for printing."""
+    pos, dirt = state >> SQUARES, state & ALL_DIRTY
+    return (label(pos),) + tuple('Dirty' if dirt >> i & 1 else 'Clean' for i in range(SQUARES))
+
+
+def configure(squares):
+    """N-square corridor: start on the last square, all dirty; goal = on A, all clean."""
+    global SQUARES, ALL_DIRTY, INITIAL_STATE, GOAL_STATE
+    SQUARES, ALL_DIRTY = squares, (1 << squares) - 1
+    INITIAL_STATE = encode(squares - 1, ALL_DIRTY)
+    GOAL_STATE = encode(0, 0)
+
+
+configure(SQUARES)
+
+
+def successor_fn(state):
+    """Yield Suck, Left, Right results (only the applicable ones)."""
+    pos = state >> SQUARES
+    if state >> pos & 1:
+        yield state & ~(1 << pos)                 # Suck
+    if pos > 0:
+        yield state - (1 << SQUARES)              # Left
+    if pos < SQUARES - 1:
+        yield state + (1 << SQUARES)              # Right
 
 # --- node abstraction -------------------------------------------------------- #
 class Node:
+    __slots__ = ('STATE', 'PARENT_NODE', 'DEPTH')
+
     def __init__(self, state, parent=None, depth=0):
         self.STATE, self.PARENT_NODE, self.DEPTH = state, parent, depth
     def path(self):
         n, p = self, []
         while n: p.append(n); n = n.PARENT_NODE
         return p[::-1]
-    def __repr__(self): return f"{self.STATE}"
+    def __repr__(self): return f"{decode(self.STATE)}"
 
 # --- fringe ops (BFS) -------------------------------------------------------- #
 def INSERT(node, queue):           # rear-insert ⇒ FIFO
-    queue.append(node); return queue
+    queue.insert(node); return queue
 
 def INSERT_ALL(nodes, queue):
-    queue.extend(nodes); return queue
+    queue.insert_all(nodes); return queue
 
-def REMOVE_FIRST(queue):           # pop front
-    return queue.pop(0)
+def REMOVE_FIRST(queue):           # pop front, O(1)
+    return queue.remove_first()
 
 # --- algorithm -------------------------------------------------------------- #
-def EXPAND(node):
-    return [Node(s, node, node.DEPTH+1) for s in STATE_SPACE[node.STATE]]
+def EXPAND(node, explored=None):
+    """Children of *node*, skipping states already marked in the *explored* bitmap."""
+    if explored is None:
+        return [Node(s, node, node.DEPTH+1) for s in successor_fn(node.STATE)]
+    return [Node(s, node, node.DEPTH+1) for s in successor_fn(node.STATE)
+            if not explored[s >> 3] & 1 << (s & 7)]
 
-def TREE_SEARCH():
-    fringe, explored = INSERT(Node(INITIAL_STATE), []), set()
-    step = 0
+def TREE_SEARCH(observer=None):
+    fringe = INSERT(Node(INITIAL_STATE), FIFOFringe())
+    explored = bytearray((SQUARES << SQUARES) // 8 + 1)     # bit per state code
     while fringe:
         node = REMOVE_FIRST(fringe)
-        print(f"Step {step:>2} | expand {node} | fringe -> {fringe}"); step += 1
-        if node.STATE == GOAL_STATE: return node.path()
-        if node.STATE not in explored:
-            explored.add(node.STATE)
-            INSERT_ALL(EXPAND(node), fringe)
+        if observer is not None: observer.on_select(node, fringe)
+        if node.STATE == GOAL_STATE:
+            if observer is not None: observer.on_goal(node)
+            return node.path()
+        byte, bit = node.STATE >> 3, 1 << (node.STATE & 7)
+        if not explored[byte] & bit:
+            explored[byte] |= bit
+            children = EXPAND(node, explored)
+            INSERT_ALL(children, fringe)
+            if observer is not None: observer.on_expand(node, children, fringe)
+        elif observer is not None:
+            observer.on_duplicate(node)
     return None
 
 # --- demo ------------------------------------------------------------------- #
 if __name__ == '__main__':
-    sol = TREE_SEARCH()
-    print("\nSolution path:", ' -> '.join(str(n.STATE) for n in sol))
+    import argparse
+    import time
+    parser = argparse.ArgumentParser(description="BFS in the N-square vacuum world")
+    parser.add_argument('--squares', type=int, default=SQUARES, help='corridor length N')
+    parser.add_argument('--quiet', action='store_true', help='no step trace; print counters instead')
+    args = parser.parse_args()
+    configure(args.squares)
+    counters = CounterObserver()
+    t0 = time.perf_counter()
+    sol = TREE_SEARCH(counters if args.quiet else StepTraceObserver())
+    if args.quiet:
+        print(f"N={SQUARES}: {len(sol) - 1} actions in {time.perf_counter() - t0:.2f}s | {counters.report()}")
+    else:
+        print("\nSolution path:", ' -> '.join(str(n) for n in sol))
@@ -0,0 +1,248 @@
+"""
+Lab 02 ▸ External-Memory BFS (disk-backed frontier & explored set)
+==================================================================
+Takeaways:
+    • Layer d = sorted file of unique uint64 states on disk (`layer_00000d.u64`),
+      with `parents_00000d.u64` = sorted (state, parent) pairs for path rebuild.
+    • Expanding a layer streams it in budget-sized chunks; generated
+      (child, parent) pairs are sorted in RAM and spilled as *runs*, then a
+      k-way merge removes duplicates and subtracts the last `window` layers.
+    • window=2 (layers d, d-1) is exact only when every move can be undone,
+      as in the river crossing: a child of layer d then lies in d-1, d or
+      d+1.  With one-way moves (the vacuum world's Suck cannot be undone) a
+      child may sit in an older layer and would be re-expanded – possibly
+      forever.  Use window=None (`--window 0`) to subtract every layer, or
+      any window > the largest depth drop along one move.
+    • RAM use is bounded by `--mem` (≈ 64 bytes per buffered pair in CPython).
+    • `manifest.json` is rewritten atomically after each finished layer ⇒ a
+      killed run resumes from the last complete layer.
+    • States must be ints in [0, 2**64) – e.g. `homework` bitmasks.
+
+Run:
+    python external_bfs.py --n 18 --mem 64M --dir /tmp/xbfs
+    python external_bfs.py --n 18 --mem 64M --dir /tmp/xbfs      # resumes / reuses
+"""
+
+import argparse
+import heapq
+import json
+import mmap
+import os
+import struct
+from array import array
+from typing import Callable, Iterable, Iterator, List, Optional
+
+PAIR = struct.Struct("<QQ")
+BYTES_PER_PAIR_IN_RAM = 64
+
+
+def parse_size(text: str) -> int:
+    """'512M' → 536870912; accepts K/M/G suffixes (binary units)."""
+    units = {"K": 1 << 10, "M": 1 << 20, "G": 1 << 30}
+    text = text.strip().upper().rstrip("B")
+    if text and text[-1] in units:
+        return int(float(text[:-1]) * units[text[-1]])
+    return int(text)
+
+# ── file helpers ────────────────────────────────────────────────────────────
+
+def _read_u64(path: str, chunk: int = 1 << 16) -> Iterator[int]:
+    if not os.path.exists(path):
+        return
+    with open(path, "rb") as f:
+        while True:
+            buf = array("Q")
+            try:
+                buf.fromfile(f, chunk)
+            except EOFError:
+                pass                                  # short final chunk
+            if not buf:
+                return
+            yield from buf
+
+
+def _read_pairs(path: str) -> Iterator[tuple]:
+    it = _read_u64(path)
+    return zip(it, it)
+
+
+def _write_atomic(path: str, data: dict) -> None:
+    tmp = path + ".tmp"
+    with open(tmp, "w") as f:
+        json.dump(data, f)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+class ExternalBFS:
+    """Breadth-first search whose layers live in *workdir*."""
+
+    def __init__(self, workdir: str, successor_fn: Callable[[int], Iterable[int]],
+                 mem: int = 512 << 20, window: Optional[int] = 2):
+        self.dir = workdir
+        self.successor_fn = successor_fn
+        self.max_pairs = max(1, mem // BYTES_PER_PAIR_IN_RAM)
+        self.window = window
+        os.makedirs(workdir, exist_ok=True)
+        self.manifest_path = os.path.join(workdir, "manifest.json")
+
+    def _layer(self, d: int) -> str:
+        return os.path.join(self.dir, f"layer_{d:06d}.u64")
+
+    def _parents(self, d: int) -> str:
+        return os.path.join(self.dir, f"parents_{d:06d}.u64")
+
+    def _run(self, i: int) -> str:
+        return os.path.join(self.dir, f"run_{i:06d}.u64")
+
+    # ── search ──────────────────────────────────────────────────────────────
+    def search(self, start: int, goal: int, log: Optional[Callable[[str], None]] = None) -> Optional[List[int]]:
+        state = self._load_or_init(start, goal)
+        while state["found"] is None and not state["exhausted"]:
+            d = state["depth"]
+            size = self._expand(d)
+            state["depth"] = d + 1
+            state["sizes"].append(size)
+            if size == 0:
+                state["exhausted"] = True
+            elif self._contains(self._layer(d + 1), goal):
+                state["found"] = d + 1
+            _write_atomic(self.manifest_path, state)   # layer d+1 is now durable
+            if log:
+                log(f"layer {d + 1:4}: {size} states")
+        return None if state["found"] is None else self.path(goal, state["found"])
+
+    def _load_or_init(self, start: int, goal: int) -> dict:
+        if os.path.exists(self.manifest_path):
+            with open(self.manifest_path) as f:
+                state = json.load(f)
+            if state["start"] == start and state["goal"] == goal and state["window"] == self.window:
+                self._cleanup(state["depth"])
+                return state
+        state = {"start": start, "goal": goal, "window": self.window, "depth": 0,
+                 "sizes": [1], "found": 0 if start == goal else None, "exhausted": False}
+        self._cleanup(-1)
+        with open(self._layer(0), "wb") as f:
+            array("Q", [start]).tofile(f)
+        open(self._parents(0), "wb").close()
+        _write_atomic(self.manifest_path, state)
+        return state
+
+    def _cleanup(self, depth: int) -> None:
+        """Remove runs and any layer newer than *depth* (half-written before a crash)."""
+        for name in os.listdir(self.dir):
+            if name.startswith("run_"):
+                os.remove(os.path.join(self.dir, name))
+            elif name.startswith(("layer_", "parents_")):
+                if int(name.split("_")[1].split(".")[0]) > depth:
+                    os.remove(os.path.join(self.dir, name))
+
+    def _expand(self, d: int) -> int:
+        """Write layer d+1 (and its parents) from layer d; return its size."""
+        # 1) generate (child, parent) pairs, spill sorted runs of ≤ max_pairs
+        runs, buf = [], []
+        for s in _read_u64(self._layer(d)):
+            for c in self.successor_fn(s):
+                buf.append(c << 64 | s)
+                if len(buf) >= self.max_pairs:
+                    runs.append(self._spill(buf, len(runs)))
+                    buf = []
+        if buf or not runs:
+            runs.append(self._spill(buf, len(runs)))
+
+        # 2) k-way merge, drop duplicates and states of the last `window` layers
+        first = 0 if self.window is None else max(0, d - self.window + 1)
+        seen = heapq.merge(*(_read_u64(self._layer(k)) for k in range(first, d + 1)))
+        old = next(seen, None)
+        size = 0
+        with open(self._layer(d + 1), "wb") as lf, open(self._parents(d + 1), "wb") as pf:
+            lbuf, pbuf, last = array("Q"), array("Q"), None
+            for c, p in heapq.merge(*(_read_pairs(r) for r in runs)):
+                if c == last:
+                    continue
+                last = c
+                while old is not None and old < c:
+                    old = next(seen, None)
+                if old == c:
+                    continue
+                lbuf.append(c)
+                pbuf.extend((c, p))
+                size += 1
+                if len(lbuf) >= 1 << 16:
+                    lbuf.tofile(lf); pbuf.tofile(pf)
+                    lbuf, pbuf = array("Q"), array("Q")
+            lbuf.tofile(lf); pbuf.tofile(pf)
+            lf.flush(); pf.flush()
+            os.fsync(lf.fileno()); os.fsync(pf.fileno())
+        for r in runs:
+            os.remove(r)
+        return size
+
+    def _spill(self, buf: List[int], i: int) -> str:
+        buf.sort()
+        out = array("Q")
+        mask = (1 << 64) - 1
+        for key in buf:
+            out.extend((key >> 64, key & mask))
+        path = self._run(i)
+        with open(path, "wb") as f:
+            out.tofile(f)
+        return path
+
+    # ── lookups on sorted files (binary search through mmap) ───────────────
+    @staticmethod
+    def _bisect(path: str, key: int, stride: int) -> Optional[int]:
+        """Record index whose first u64 equals *key* in a sorted file, else None."""
+        size = os.path.getsize(path)
+        if size == 0:
+            return None
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            lo, hi = 0, size // (8 * stride)
+            while lo < hi:
+                mid = (lo + hi) // 2
+                v = struct.unpack_from("<Q", mm, mid * 8 * stride)[0]
+                if v < key:
+                    lo = mid + 1
+                else:
+                    hi = mid
+            if lo < size // (8 * stride) and struct.unpack_from("<Q", mm, lo * 8 * stride)[0] == key:
+                return lo
+        return None
+
+    def _contains(self, path: str, state: int) -> bool:
+        return self._bisect(path, state, 1) is not None
+
+    def path(self, goal: int, depth: int) -> List[int]:
+        """Rebuild start → goal by following parent pointers down the layers."""
+        out, s = [goal], goal
+        for d in range(depth, 0, -1):
+            i = self._bisect(self._parents(d), s, 2)
+            with open(self._parents(d), "rb") as f:
+                f.seek(i * PAIR.size)
+                s = PAIR.unpack(f.read(PAIR.size))[1]
+            out.append(s)
+        return out[::-1]
+
+
+if __name__ == "__main__":
+    import homework
+    from bench_bidirectional import scaled_puzzle
+
+    parser = argparse.ArgumentParser(description="External-memory BFS on a scaled river crossing")
+    parser.add_argument("--n", type=int, default=16, help="entities (Farmer/Wolf/Goat/Cabbage + inert)")
+    parser.add_argument("--mem", type=parse_size, default=parse_size("512M"), help="RAM budget, e.g. 512M")
+    parser.add_argument("--dir", default="xbfs_work", help="work directory (resumable)")
+    parser.add_argument("--window", type=int, default=2,
+                        help="layers subtracted per step (0 = all; 2 is exact for reversible moves)")
+    args = parser.parse_args()
+
+    scaled_puzzle(args.n)
+    engine = ExternalBFS(args.dir, homework.successor_fn, args.mem, args.window or None)
+    sol = engine.search(homework.INIT_MASK, homework.GOAL_MASK, log=print)
+    if sol:
+        for step, st in enumerate(sol):
+            print(f"{step:2}: {homework.decode(st)}")
+        print("\nMoves:", len(sol) - 1)
+    else:
+        print("No solution found.")
@@ -0,0 +1,94 @@
+"""
+Lab 02 ▸ Fringe Abstraction (FIFO / LIFO / priority)
+====================================================
+Takeaways:
+    • FIFO  ➜ `collections.deque` append + popleft        ➜ Breadth-First Search
+    • LIFO  ➜ `collections.deque` appendleft + popleft    ➜ Depth-First Search
+    • Priority ➜ `heapq` on (path-cost, insertion no.)    ➜ Uniform-Cost Search
+    • Every insert / remove is O(1) (O(log n) for the heap) – `list.pop(0)` and
+      `list.insert(0, …)` were O(n) each and made search quadratic.
+    • `make_fringe(strategy)` picks the fringe at run time – no global toggle.
+"""
+
+import heapq
+from collections import deque
+from itertools import count
+
+
+class FIFOFringe:
+    """Rear insert, front removal ⇒ queue."""
+
+    __slots__ = ("_q",)
+
+    def __init__(self):
+        self._q = deque()
+
+    def insert(self, node):
+        self._q.append(node)
+
+    def insert_all(self, nodes):
+        self._q.extend(nodes)
+
+    def remove_first(self):
+        return self._q.popleft()
+
+    def __len__(self):
+        return len(self._q)
+
+    def __iter__(self):
+        return iter(self._q)
+
+    def __repr__(self):
+        return repr(list(self._q))
+
+
+class LIFOFringe(FIFOFringe):
+    """Front insert, front removal ⇒ stack (children pushed one by one, as in
+    the lab's `queue.insert(0, node)` loop, so the last child comes out first)."""
+
+    __slots__ = ()
+
+    def insert(self, node):
+        self._q.appendleft(node)
+
+    def insert_all(self, nodes):
+        self._q.extendleft(nodes)
+
+
+class PriorityFringe:
+    """Lowest `key(node)` first; ties leave in insertion order."""
+
+    __slots__ = ("_heap", "_key", "_tie")
+
+    def __init__(self, key=lambda node: node.PATH_COST):
+        self._heap, self._key, self._tie = [], key, count()
+
+    def insert(self, node):
+        heapq.heappush(self._heap, (self._key(node), next(self._tie), node))
+
+    def insert_all(self, nodes):
+        for node in nodes:
+            self.insert(node)
+
+    def remove_first(self):
+        return heapq.heappop(self._heap)[2]
+
+    def __len__(self):
+        return len(self._heap)
+
+    def __iter__(self):
+        return (entry[2] for entry in sorted(self._heap))
+
+    def __repr__(self):
+        return repr(list(self))
+
+
+STRATEGIES = {'BFS': FIFOFringe, 'DFS': LIFOFringe, 'UCS': PriorityFringe}
+
+
+def make_fringe(strategy='BFS'):
+    """Empty fringe for 'BFS', 'DFS' or 'UCS'."""
+    try:
+        return STRATEGIES[strategy]()
+    except KeyError:
+        raise ValueError(f"unknown strategy {strategy!r}; pick one of {sorted(STRATEGIES)}") from None
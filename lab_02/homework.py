@@ -14,9 +14,15 @@ CONFIG
 
 The algorithm auto‑builds successor moves and validity checks from these
 settings.
+
+Encoding: a state is an int bitmask, bit i = 1 ⇔ ENTITIES[i] is on BANKS[1].
+Crossing = XOR, safety = precomputed pair-mask test, explored set = bitmap
+with one bit per possible state (2**n bits).  States are decoded back to
+bank-label tuples only for the printed path.
 """
+import argparse
 from collections import deque
-from typing import List, Tuple, Sequence
+from typing import List, Tuple
 
 # ── CONFIG ─────────────────────────────────────────────────────────────────
 BANKS: Tuple[str, str] = ("W", "E")
@@ -28,77 +34,148 @@ UNSAFE_PAIRS: List[Tuple[int, int]] = [  # indexes into ENTITIES
     (2, 3),  # Goat eats Cabbage
 ]
 
-# ── DERIVED FUNCTIONS ──────────────────────────────────────────────────────
+# ── DERIVED ENCODING ───────────────────────────────────────────────────────
 DRIVER_IDX: int = 0  # first entity must pilot the boat
 
 
-def opposite(side: str) -> str:
-    a, b = BANKS
-    return b if side == a else a
+def encode(state: Tuple[str, ...]) -> int:
+    return sum(1 << i for i, side in enumerate(state) if side == BANKS[1])
+
+
+def decode(mask: int) -> Tuple[str, ...]:
+    return tuple(BANKS[(mask >> i) & 1] for i in range(len(ENTITIES)))
 
 
-def is_valid(state: Sequence[str]) -> bool:
+def configure(entities: Tuple[str, ...] = ENTITIES,
+              init_state: Tuple[str, ...] = INIT_STATE,
+              goal_state: Tuple[str, ...] = GOAL_STATE,
+              unsafe_pairs: List[Tuple[int, int]] = UNSAFE_PAIRS) -> None:
+    """Swap in another puzzle (same meaning as CONFIG) and rebuild the masks."""
+    global ENTITIES, INIT_STATE, GOAL_STATE, UNSAFE_PAIRS
+    global DRIVER_BIT, ALL, PAIR_MASKS, INIT_MASK, GOAL_MASK
+    ENTITIES, INIT_STATE, GOAL_STATE, UNSAFE_PAIRS = entities, init_state, goal_state, unsafe_pairs
+    DRIVER_BIT = 1 << DRIVER_IDX
+    ALL = (1 << len(ENTITIES)) - 1
+    PAIR_MASKS = [(1 << a) | (1 << b) for a, b in UNSAFE_PAIRS]
+    INIT_MASK, GOAL_MASK = encode(INIT_STATE), encode(GOAL_STATE)
+
+
+DRIVER_BIT: int
+ALL: int
+PAIR_MASKS: List[int]
+INIT_MASK: int
+GOAL_MASK: int
+configure()
+
+# ── DERIVED FUNCTIONS ──────────────────────────────────────────────────────
+
+def is_valid(state: int) -> bool:
     """Return False if any unsafe pair is alone without the driver."""
-    driver_side = state[DRIVER_IDX]
-    for predator, prey in UNSAFE_PAIRS:
-        if state[predator] == state[prey] != driver_side:
+    unattended = state ^ ALL if state & DRIVER_BIT else state  # bank without driver
+    for m in PAIR_MASKS:
+        if unattended & m == m:
             return False
     return True
 
 
-def successor_fn(state: Tuple[str, ...]) -> List[Tuple[str, ...]]:
+def successor_fn(state: int) -> List[int]:
     """Generate all legal successor states (driver alone or driver + one)."""
-    succ: List[Tuple[str, ...]] = []
-    driver_side = state[DRIVER_IDX]
+    succ: List[int] = []
     # Move driver alone
-    candidate = list(state)
-    candidate[DRIVER_IDX] = opposite(driver_side)
+    candidate = state ^ DRIVER_BIT
     if is_valid(candidate):
-        succ.append(tuple(candidate))
-    # Move driver + each passenger on same side
-    for idx, side in enumerate(state):
-        if idx == DRIVER_IDX or side != driver_side:
-            continue
-        candidate2 = list(candidate)  # start from driver‑moved version
-        candidate2[idx] = opposite(side)
+        succ.append(candidate)
+    # Move driver + each passenger on same side (ascending entity index)
+    same_side = (state if state & DRIVER_BIT else state ^ ALL) & ~DRIVER_BIT
+    while same_side:
+        low = same_side & -same_side
+        candidate2 = candidate ^ low  # start from driver‑moved version
         if is_valid(candidate2):
-            succ.append(tuple(candidate2))
+            succ.append(candidate2)
+        same_side ^= low
     return succ
 
 # ── BFS ENGINE ─────────────────────────────────────────────────────────────
 class Node:
     __slots__ = ("state", "parent")
 
-    def __init__(self, state: Tuple[str, ...], parent: "Node | None" = None):
+    def __init__(self, state: int, parent: "Node | None" = None):
         self.state, self.parent = state, parent
 
     def path(self) -> List[Tuple[str, ...]]:
         out, n = [], self
         while n:
-            out.append(n.state)
+            out.append(decode(n.state))
             n = n.parent
         return out[::-1]
 
 
 def bfs() -> List[Tuple[str, ...]] | None:
-    fringe: deque[Node] = deque([Node(INIT_STATE)])
-    explored: set[Tuple[str, ...]] = set()
+    fringe: deque[Node] = deque([Node(INIT_MASK)])
+    explored = bytearray((1 << len(ENTITIES)) // 8 + 1)  # 1 bit per state
     while fringe:
         node = fringe.popleft()
-        if node.state == GOAL_STATE:
+        s = node.state
+        if s == GOAL_MASK:
             return node.path()
-        if node.state in explored:
+        if explored[s >> 3] >> (s & 7) & 1:
             continue
-        explored.add(node.state)
-        for s in successor_fn(node.state):
-            if s not in explored:
-                fringe.append(Node(s, node))
+        explored[s >> 3] |= 1 << (s & 7)
+        for c in successor_fn(s):
+            if not explored[c >> 3] >> (c & 7) & 1:
+                fringe.append(Node(c, node))
     return None
 
 
+def bidirectional_bfs() -> List[Tuple[str, ...]] | None:
+    """
+    Meet-in-the-middle BFS from INIT and GOAL (moves are reversible, so the
+    backward successors are `successor_fn` too).  Expands one whole level of
+    the smaller frontier at a time and stops at the first state already seen
+    by the other side – level-synchronous expansion keeps that path shortest.
+    """
+    if INIT_MASK == GOAL_MASK:
+        return [decode(INIT_MASK)]
+    if not is_valid(GOAL_MASK):  # forward moves only ever reach valid states
+        return None
+    parents = ({INIT_MASK: None}, {GOAL_MASK: None})  # forward / backward trees
+    frontiers = ([INIT_MASK], [GOAL_MASK])
+    while frontiers[0] and frontiers[1]:
+        side = 0 if len(frontiers[0]) <= len(frontiers[1]) else 1
+        mine, other = parents[side], parents[1 - side]
+        nxt: List[int] = []
+        for s in frontiers[side]:
+            for c in successor_fn(s):
+                if c in mine:
+                    continue
+                mine[c] = s
+                if c in other:
+                    return _join(parents, c)
+                nxt.append(c)
+        frontiers = (nxt, frontiers[1]) if side == 0 else (frontiers[0], nxt)
+    return None
+
+
+def _join(parents, meet: int) -> List[Tuple[str, ...]]:
+    """Splice INIT → meet (forward parents) and meet → GOAL (backward parents)."""
+    fwd, bwd = parents
+    head, s = [], meet
+    while s is not None:
+        head.append(s)
+        s = fwd[s]
+    tail, s = [], bwd[meet]
+    while s is not None:
+        tail.append(s)
+        s = bwd[s]
+    return [decode(m) for m in head[::-1] + tail]
+
+
 # ── DEMO RUN ───────────────────────────────────────────────────────────────
 if __name__ == "__main__":
-    sol = bfs()
+    parser = argparse.ArgumentParser(description="Farmer, wolf, goat & cabbage by BFS")
+    parser.add_argument("--bidirectional", action="store_true", help="meet-in-the-middle BFS")
+    args = parser.parse_args()
+    sol = bidirectional_bfs() if args.bidirectional else bfs()
     if sol:
         for step, st in enumerate(sol):
             print(f"{step:2}: {st}")
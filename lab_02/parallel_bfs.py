@@ -0,0 +1,104 @@
+"""
+Lab 02 ▸ Level-Synchronous Parallel BFS
+=======================================
+Takeaways:
+    • BFS explores level by level ⇒ every state of one level can be expanded
+      independently.  Each level is cut into chunks that a
+      `ProcessPoolExecutor` expands in parallel.
+    • Duplicates are removed **centrally** in the parent process, visiting the
+      chunk results in frontier order and children in successor order – the
+      same first-come order as a sequential FIFO, so the parent map (and the
+      returned shortest path) is identical to `bfs()`'s.
+    • Works with any picklable (module-level) `successor_fn`; pass
+      `initializer` / `initargs` when workers must rebuild module state
+      (e.g. `homework.configure`) under the *spawn* start method.
+    • Small levels (< `chunk_size` states) are expanded in-process to skip
+      IPC overhead.
+
+Run:
+    python parallel_bfs.py                      # river crossing, n = 16
+    python parallel_bfs.py --n 20 --workers 8
+"""
+
+import argparse
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, Hashable, Iterable, List, Optional
+
+State = Hashable
+
+
+def _expand_chunk(successor_fn: Callable[[State], Iterable[State]], chunk: List[State]):
+    return [list(successor_fn(s)) for s in chunk]
+
+
+def parallel_bfs(start: State,
+                 goal,
+                 successor_fn: Callable[[State], Iterable[State]],
+                 workers: Optional[int] = None,
+                 chunk_size: int = 4096,
+                 initializer: Optional[Callable] = None,
+                 initargs: tuple = ()) -> Optional[List[State]]:
+    """
+    Shortest path of states from *start* to *goal* (a state or a predicate),
+    or None.  *workers* = None ⇒ one process per CPU core.
+    """
+    is_goal = goal if callable(goal) else (lambda s: s == goal)
+    if is_goal(start):
+        return [start]
+    parent: Dict[State, Optional[State]] = {start: None}
+    frontier: List[State] = [start]
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=initializer,
+                             initargs=initargs) as pool:
+        while frontier:
+            chunks = [frontier[i:i + chunk_size] for i in range(0, len(frontier), chunk_size)]
+            if len(chunks) == 1:
+                results = [_expand_chunk(successor_fn, chunks[0])]
+            else:
+                results = pool.map(_expand_chunk, [successor_fn] * len(chunks), chunks)
+
+            nxt: List[State] = []
+            for chunk, succs in zip(chunks, results):      # frontier order
+                for s, children in zip(chunk, succs):
+                    for c in children:                      # successor order
+                        if c in parent:
+                            continue
+                        parent[c] = s
+                        if is_goal(c):
+                            return _path(parent, c)
+                        nxt.append(c)
+            frontier = nxt
+    return None
+
+
+def _path(parent: Dict[State, Optional[State]], s: State) -> List[State]:
+    out = []
+    while s is not None:
+        out.append(s)
+        s = parent[s]
+    return out[::-1]
+
+
+if __name__ == "__main__":
+    import homework
+    from bench_bidirectional import scaled_puzzle
+
+    parser = argparse.ArgumentParser(description="Parallel BFS on a scaled river crossing")
+    parser.add_argument("--n", type=int, default=16, help="entities (Farmer/Wolf/Goat/Cabbage + inert)")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--chunk-size", type=int, default=4096)
+    args = parser.parse_args()
+
+    scaled_puzzle(args.n)
+    t0 = time.perf_counter()
+    seq = homework.bfs()
+    t1 = time.perf_counter()
+    par = parallel_bfs(homework.INIT_MASK, homework.GOAL_MASK, homework.successor_fn,
+                       workers=args.workers, chunk_size=args.chunk_size,
+                       initializer=scaled_puzzle, initargs=(args.n,))
+    t2 = time.perf_counter()
+
+    par = [homework.decode(s) for s in par]
+    print(f"n={args.n}: bfs {t1 - t0:.2f}s | parallel_bfs {t2 - t1:.2f}s | "
+          f"moves {len(par) - 1} | same path: {par == seq}")
@@ -6,7 +6,15 @@ Takeaways:
     • **Rear‑insert  ➜ FIFO ➜ Breadth‑First Search** (queue behaviour)
     • Fringe trace reveals node‑expansion order
     • State‑space size small ⇒ manual tracing feasible.
+    • Fringe = `fringe.py` deque/heap ⇒ O(1) insert/remove; strategy ('BFS',
+      'DFS', 'UCS') is a TREE_SEARCH argument, STRATEGY only the default.
+    • Tracing / counters / timers are `search_hooks` observers ⇒ free when off.
+    • 'DLS' / 'IDS' ⇒ depth-limited & iterative-deepening DFS on an explicit
+      stack of successor iterators: O(depth) memory, no Node per sibling,
+      BFS-optimal depth; expansions are reported per iteration.
 """
+from fringe import make_fringe
+from search_hooks import CounterObserver, Observers, StepTraceObserver, TimerObserver
 
 # -------- search graph (letters A‑J) ----------------------------------------
 STATE_SPACE = {
@@ -18,15 +26,18 @@ STATE_SPACE = {
 }
 INITIAL_STATE, GOAL_STATE = 'A', 'J'
 
-# -------- search control toggle --------------------------------------------
-STRATEGY = 'BFS'  # set to 'BFS' to switch behaviour
+# -------- search control default -------------------------------------------
+STRATEGY = 'BFS'  # default for TREE_SEARCH(): 'BFS', 'DFS' or 'UCS'
 
 # -------- node ----------------------------------------------------------------
 class Node:
-    def __init__(self, state, parent=None, depth=0):
+    __slots__ = ('STATE', 'PARENT_NODE', 'DEPTH', 'PATH_COST')
+
+    def __init__(self, state, parent=None, depth=0, path_cost=0):
         self.STATE = state
         self.PARENT_NODE = parent
         self.DEPTH = depth
+        self.PATH_COST = path_cost
 
     def path(self):
         n, p = self, []
@@ -40,52 +51,149 @@ class Node:
 
 # -------- fringe management --------------------------------------------------
 
-def INSERT(node, queue):
-    """Front insert ⇒ DFS  ;  Rear insert ⇒ BFS."""
-    if STRATEGY == 'DFS':
-        queue.insert(0, node)   # LIFO stack push
-    else:
-        queue.append(node)      # FIFO enqueue
-    return queue
+def INSERT(node, fringe):
+    """Rear insert (FIFO) ⇒ BFS ; front insert (LIFO) ⇒ DFS ; by cost ⇒ UCS."""
+    fringe.insert(node)
+    return fringe
 
 
-def INSERT_ALL(nodes, queue):
-    """Maintain child order while delegating to INSERT."""
-    for n in nodes:
-        INSERT(n, queue)
-    return queue
+def INSERT_ALL(nodes, fringe):
+    """Maintain child order while delegating to the fringe."""
+    fringe.insert_all(nodes)
+    return fringe
 
 
-def REMOVE_FIRST(queue):
-    return queue.pop(0)         # always pop front
+def REMOVE_FIRST(fringe):
+    return fringe.remove_first()
 
 # -------- helper ------------------------------------------------------------
 
 def successor_fn(state):
     return STATE_SPACE[state]
 
+
+def step_cost(state, child):
+    return 1                    # unit costs ⇒ UCS expands like BFS here
+
 # -------- main algorithm ----------------------------------------------------
 
 def EXPAND(node):
     children = []
     for s in successor_fn(node.STATE):
-        children.append(Node(s, parent=node, depth=node.DEPTH + 1))
+        children.append(Node(s, parent=node, depth=node.DEPTH + 1,
+                             path_cost=node.PATH_COST + step_cost(node.STATE, s)))
     return children
 
 
-def TREE_SEARCH():
-    fringe = INSERT(Node(INITIAL_STATE), [])
-    step = 0
+def TREE_SEARCH(strategy=None, observer=None):
+    fringe = INSERT(Node(INITIAL_STATE), make_fringe(strategy or STRATEGY))
     while fringe:
         node = REMOVE_FIRST(fringe)
-        print(f"Step {step:>2} | expand {node} | fringe -> {fringe}")
-        step += 1
+        if observer is not None:
+            observer.on_select(node, fringe)
         if node.STATE == GOAL_STATE:
+            if observer is not None:
+                observer.on_goal(node)
             return node.path()
-        fringe = INSERT_ALL(EXPAND(node), fringe)
+        children = EXPAND(node)
+        fringe = INSERT_ALL(children, fringe)
+        if observer is not None:
+            observer.on_expand(node, children, fringe)
     return None
 
+# -------- depth-limited / iterative deepening -------------------------------
+CUTOFF = 'cutoff'               # DLS result: depth limit hit, no goal found
+_EXHAUSTED = object()           # next() default: a level's successors are used up
+
+
+def _path_nodes(states):
+    """Build Nodes for the solution path only (same shape as TREE_SEARCH's result)."""
+    node = None
+    for s in states:
+        node = Node(s, parent=node, depth=0 if node is None else node.DEPTH + 1,
+                    path_cost=0 if node is None else node.PATH_COST + step_cost(node.STATE, s))
+    return node.path()
+
+
+def DEPTH_LIMITED_SEARCH(limit, stats=None):
+    """
+    DFS to depth *limit*.  Memory = one successor iterator + one state per
+    level.  Returns the path, CUTOFF, or None (space exhausted).  If given,
+    *stats*['expanded'] is incremented per expanded state.
+    """
+    if INITIAL_STATE == GOAL_STATE:
+        return _path_nodes([INITIAL_STATE])
+    if limit <= 0:
+        return CUTOFF
+    states, stack = [INITIAL_STATE], [iter(successor_fn(INITIAL_STATE))]
+    expanded, cutoff = 1, False
+    while stack:
+        s = next(stack[-1], _EXHAUSTED)
+        if s is _EXHAUSTED:                          # level exhausted ⇒ backtrack
+            stack.pop()
+            states.pop()
+            continue
+        if s == GOAL_STATE:
+            if stats is not None:
+                stats['expanded'] = stats.get('expanded', 0) + expanded
+            return _path_nodes(states + [s])
+        if len(stack) < limit:
+            states.append(s)
+            stack.append(iter(successor_fn(s)))
+            expanded += 1
+        else:
+            cutoff = True
+    if stats is not None:
+        stats['expanded'] = stats.get('expanded', 0) + expanded
+    return CUTOFF if cutoff else None
+
+
+def ITERATIVE_DEEPENING_SEARCH(max_depth=None, stats=None):
+    """
+    DLS with limit 0, 1, 2, … until the result is not CUTOFF.  Returns
+    CUTOFF if *max_depth* is reached first (None = no cap).
+    *stats*['per_iteration'] collects the expansions of each iteration.
+    """
+    per_iteration = []
+    if stats is not None:
+        stats['per_iteration'] = per_iteration
+    limit = 0
+    while max_depth is None or limit <= max_depth:
+        it = {}
+        result = DEPTH_LIMITED_SEARCH(limit, it)
+        per_iteration.append(it.get('expanded', 0))
+        if result is not CUTOFF:
+            return result
+        limit += 1
+    return CUTOFF
+
 # -------- demo --------------------------------------------------------------
 if __name__ == '__main__':
-    path = TREE_SEARCH()
-    print("\nSolution path:", ' -> '.join(n.STATE for n in path))
+    import argparse
+    parser = argparse.ArgumentParser(description="Uninformed tree search")
+    parser.add_argument('strategy', nargs='?', default=STRATEGY, choices=('BFS', 'DFS', 'UCS', 'DLS', 'IDS'))
+    parser.add_argument('--stats', action='store_true', help='print counters and phase timers')
+    parser.add_argument('--limit', type=int, default=None,
+                        help='depth limit for DLS (default 3) / max depth for IDS (default none)')
+    args = parser.parse_args()
+    if args.strategy in ('DLS', 'IDS'):
+        stats = {}
+        if args.strategy == 'DLS':
+            limit = 3 if args.limit is None else args.limit
+            path = DEPTH_LIMITED_SEARCH(limit, stats)
+            print(f"Depth limit {limit}: {stats.get('expanded', 0)} expanded")
+        else:
+            path = ITERATIVE_DEEPENING_SEARCH(max_depth=args.limit, stats=stats)
+            for depth, n in enumerate(stats['per_iteration']):
+                print(f"Iteration {depth:>2} | limit {depth} | {n} expanded")
+        if path in (None, CUTOFF):
+            print(f"\nNo solution ({path})")
+        else:
+            print("\nSolution path:", ' -> '.join(n.STATE for n in path))
+    else:
+        counters, timers = CounterObserver(), TimerObserver()
+        path = TREE_SEARCH(args.strategy, Observers(StepTraceObserver(), counters, timers))
+        print("\nSolution path:", ' -> '.join(n.STATE for n in path))
+        if args.stats:
+            print("Counters:", counters.report())
+            print("Seconds :", timers.report())
@@ -0,0 +1,122 @@
+"""
+Lab 02 ▸ Search Instrumentation Hooks
+=====================================
+One observer protocol for `search.py`, `exercise_2.py` and
+`lab_03/informed_search.py`.  The search loops call
+
+    on_select(node, fringe)            node just removed from the fringe
+    on_duplicate(node)                 selected node skipped (already explored)
+    on_expand(node, children, fringe)  children generated and inserted
+    on_goal(node)                      goal node selected
+
+only when an observer is attached (`if observer is not None`), so an
+uninstrumented search pays one pointer test per step and builds no strings.
+
+Takeaways:
+    • `CounterObserver` – expanded / generated / duplicates / peak fringe size.
+    • `TimerObserver`   – per-phase wall time derived from event timestamps:
+                          'expand' = select → expand (goal test + successors),
+                          'fringe' = expand → next select (insert + remove).
+    • Trace observers (one per module) reproduce each lab's printed output.
+    • `Observers(a, b, …)` fans events out to several observers.
+"""
+
+import time
+from collections import defaultdict
+
+
+class SearchObserver:
+    """No-op base; override only the events you need."""
+
+    def on_select(self, node, fringe):
+        pass
+
+    def on_duplicate(self, node):
+        pass
+
+    def on_expand(self, node, children, fringe):
+        pass
+
+    def on_goal(self, node):
+        pass
+
+
+class CounterObserver(SearchObserver):
+    def __init__(self):
+        self.expanded = self.generated = self.duplicates = self.peak_fringe = 0
+
+    def on_select(self, node, fringe):
+        self.peak_fringe = max(self.peak_fringe, len(fringe) + 1)
+
+    def on_duplicate(self, node):
+        self.duplicates += 1
+
+    def on_expand(self, node, children, fringe):
+        self.expanded += 1
+        self.generated += len(children)
+        self.peak_fringe = max(self.peak_fringe, len(fringe))
+
+    def report(self):
+        return {'expanded': self.expanded, 'generated': self.generated,
+                'duplicates': self.duplicates, 'peak_fringe': self.peak_fringe}
+
+
+class TimerObserver(SearchObserver):
+    def __init__(self):
+        self.seconds = defaultdict(float)
+        self._last = None
+
+    def _tick(self, phase):
+        now = time.perf_counter()
+        if self._last is not None and phase is not None:
+            self.seconds[phase] += now - self._last
+        self._last = now
+
+    def on_select(self, node, fringe):
+        self._tick('fringe')
+
+    def on_duplicate(self, node):
+        self._tick('expand')
+
+    def on_expand(self, node, children, fringe):
+        self._tick('expand')
+
+    def on_goal(self, node):
+        self._tick('expand')
+
+    def report(self):
+        return dict(self.seconds)
+
+
+class Observers(SearchObserver):
+    """Broadcast every event to each observer in turn."""
+
+    def __init__(self, *observers):
+        self.observers = observers
+
+    def on_select(self, node, fringe):
+        for o in self.observers:
+            o.on_select(node, fringe)
+
+    def on_duplicate(self, node):
+        for o in self.observers:
+            o.on_duplicate(node)
+
+    def on_expand(self, node, children, fringe):
+        for o in self.observers:
+            o.on_expand(node, children, fringe)
+
+    def on_goal(self, node):
+        for o in self.observers:
+            o.on_goal(node)
+
+
+class StepTraceObserver(SearchObserver):
+    """`Step  n | expand X | fringe -> [...]` trace used by search.py / exercise_2.py."""
+
+    def __init__(self):
+        self.step = 0
+
+    def on_select(self, node, fringe):
+        print(f"Step {self.step:>2} | expand {node} | fringe -> {fringe}")
+        self.step += 1
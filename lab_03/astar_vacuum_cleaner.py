@@ -6,62 +6,319 @@ Takeaways:
     • State = (location, A,B,C,D status) ⇒ |S| = 4×2⁴ = 64  (tractable graph).
     • Heuristic = count_dirty_squares -> never over‑estimates ⇒ admissible & consistent.
     • Outputs: *path*, *total cost* (moves), *nodes expanded*
+    • Memory-bounded modes with the same signature / (path, cost, expanded):
+      `ida_star_search` (O(depth) memory) and `sma_star_search(budget=…)`.
+    • Nodes live in an index arena (parallel parent / action-id / g lists);
+      heap entries are (f, tie, index) and the path is rebuilt once at the goal.
 """
 
 import heapq
-from typing import List, Tuple
+from itertools import count
+from typing import Dict, List, Optional, Tuple
 
 # ── generic A* ─────────────────────────────────────────────────── #
-class Node:
-    """Lightweight search tree node (keeps only what BFS/A* needs)"""
+# Node arena: generated node i lives at index i of parallel lists
+#   state[i], parent[i] (index, -1 for root), action[i] (id into `names`), g[i]
+# The heap holds only (f, -g, tie, i) ⇒ no per-node object, no path copying;
+# the action path is rebuilt once by walking parent indices from the goal.
+# `best_g` keeps the cheapest known g per state: dominated children are never
+# pushed and heap entries whose g is no longer the best are skipped as stale.
+# Equal f ⇒ higher g (deeper) first, then FIFO by the monotonic tie counter.
 
-    __slots__ = ("state", "path", "g")
-
-    def __init__(self, state: Tuple, path: List[str], g: int):
-        self.state, self.path, self.g = state, path, g  # g ≡ path‑cost so far
-
-    # Priority queue compares on f(n)=g+h
-    def __lt__(self, other: "Node"):
-        return False  # tie‑break handled by heap tuple (f,this)
+def _rebuild(i: int, parent: List[int], action: List[int], names: List[str]) -> List[str]:
+    path = []
+    while parent[i] >= 0:
+        path.append(names[action[i]])
+        i = parent[i]
+    return path[::-1]
 
 
 def a_star_search(start_state: Tuple,
                   goal_test,
                   successors,
-                  heuristic) -> Tuple[List[str], int, int]:
-    """Generic A* that returns (action_path, cost, expanded_nodes)."""
-    root = Node(start_state, [], 0)
-    frontier: List[Tuple[int, Node]] = []
-    heapq.heappush(frontier, (heuristic(start_state), root))
-    explored = set()
-    expanded = 0
+                  heuristic,
+                  stats: Optional[Dict[str, int]] = None) -> Tuple[List[str], int, int]:
+    """
+    Generic A* that returns (action_path, cost, expanded_nodes).
+    If *stats* is a dict it receives 'pushes', 'stale_pops' and 'reexpansions'.
+    """
+    states: List[Tuple] = [start_state]
+    parent: List[int] = [-1]
+    action: List[int] = [-1]
+    g: List[int] = [0]
+    names: List[str] = []                 # action id → action label
+    ids = {}                              # action label → id
+    tie = count()
+
+    frontier: List[Tuple[int, int, int, int]] = [(heuristic(start_state), 0, next(tie), 0)]
+    best_g = {start_state: 0}
+    closed = set()
+    expanded = stale = reexpanded = 0
+    pushes = 1
+
+    def report():
+        if stats is not None:
+            stats.update(pushes=pushes, stale_pops=stale, reexpansions=reexpanded)
 
     while frontier:
-        f, current = heapq.heappop(frontier)
-        if current.state in explored:
-            continue  # cheaper path already processed
-        explored.add(current.state)
+        f, _, _, i = heapq.heappop(frontier)
+        state = states[i]
+        if g[i] > best_g[state]:
+            stale += 1
+            continue  # cheaper entry for this state was pushed later
+        if state in closed:
+            reexpanded += 1  # g improved after closing (inconsistent h)
+        closed.add(state)
         expanded += 1
 
-        if goal_test(current.state):
-            return current.path, current.g, expanded
+        if goal_test(state):
+            report()
+            return _rebuild(i, parent, action, names), g[i], expanded
 
-        for action, new_state, step_cost in successors(current.state):
-            if new_state in explored:
-                continue
-            g_new = current.g + step_cost
-            child = Node(new_state, current.path + [action], g_new)
-            heapq.heappush(frontier, (g_new + heuristic(new_state), child))
+        for act, new_state, step_cost in successors(state):
+            g_new = g[i] + step_cost
+            if g_new >= best_g.get(new_state, float("inf")):
+                continue  # dominated by a known path
+            best_g[new_state] = g_new
+            if act not in ids:
+                ids[act] = len(names)
+                names.append(act)
+            j = len(states)
+            states.append(new_state)
+            parent.append(i)
+            action.append(ids[act])
+            g.append(g_new)
+            heapq.heappush(frontier, (g_new + heuristic(new_state), -g_new, next(tie), j))
+            pushes += 1
 
+    report()
     return [], float("inf"), expanded  # failure (should not occur here)
 
+# ── memory-bounded variants (same signature & return triple) ───────────── #
+def ida_star_search(start_state: Tuple,
+                    goal_test,
+                    successors,
+                    heuristic) -> Tuple[List[str], int, int]:
+    """
+    Iterative-deepening A*: depth-first probes bounded by f = g + h, the bound
+    rising to the smallest f that exceeded it.  Memory = O(solution depth)
+    (one successor iterator per level); states on the current path are
+    skipped to avoid cycles.  `expanded` sums over all iterations.
+    """
+    bound = heuristic(start_state)
+    expanded = 0
+    while bound < float("inf"):
+        states, actions, g = [start_state], [], [0]
+        on_path = {start_state}
+        expanded += 1
+        if goal_test(start_state):
+            return [], 0, expanded
+        stack = [iter(successors(start_state))]
+        next_bound = float("inf")
+        while stack:
+            item = next(stack[-1], None)
+            if item is None:                          # level exhausted ⇒ backtrack
+                stack.pop()
+                on_path.discard(states.pop())
+                g.pop()
+                if actions:
+                    actions.pop()
+                continue
+            act, new_state, step_cost = item
+            if new_state in on_path:
+                continue
+            g_new = g[-1] + step_cost
+            f = g_new + heuristic(new_state)
+            if f > bound:
+                next_bound = min(next_bound, f)
+                continue
+            states.append(new_state)
+            actions.append(act)
+            g.append(g_new)
+            on_path.add(new_state)
+            expanded += 1
+            if goal_test(new_state):
+                return actions, g_new, expanded
+            stack.append(iter(successors(new_state)))
+        bound = next_bound
+    return [], float("inf"), expanded
+
+
+class _SMANode:
+    __slots__ = ("state", "parent", "action", "g", "f", "depth",
+                 "children", "forgotten", "expanded", "version", "alive")
+
+    def __init__(self, state, parent, action, g, f, depth):
+        self.state, self.parent, self.action = state, parent, action
+        self.g, self.f, self.depth = g, f, depth
+        self.children: Dict[Tuple, "_SMANode"] = {}   # state → child in memory
+        self.forgotten: Dict[Tuple, float] = {}       # state → backed-up f of pruned child
+        self.expanded = False
+        self.version = 0
+        self.alive = True
+
+    def key(self) -> float:
+        """Unexpanded leaf ⇒ its f; expanded ⇒ best forgotten child to regenerate."""
+        if not self.expanded:
+            return self.f
+        return min(self.forgotten.values()) if self.forgotten else float("inf")
+
+
+def sma_star_search(start_state: Tuple,
+                    goal_test,
+                    successors,
+                    heuristic,
+                    budget: int = 100_000) -> Tuple[List[str], int, int]:
+    """
+    Simplified memory-bounded A* holding at most *budget* tree nodes.
+    When memory is full the shallowest highest-f leaf is pruned; its
+    backed-up f is kept in the parent (`forgotten[state]`) and restored
+    when the parent regenerates it, once that f is again the best on offer.
+    Every expanded node carries the min f of its children (in memory or
+    forgotten), backed up to the root after each expansion and prune.
+    Optimal whenever the optimal solution's depth < *budget*; failure once
+    the root's f is inf.  Tree search: states on the current path are skipped.
+    """
+    INF = float("inf")
+    budget = max(2, budget)
+    tie = count()
+    root = _SMANode(start_state, None, None, 0, heuristic(start_state), 0)
+    used = 1
+    open_heap: List[Tuple] = []                   # (key, -depth, tie, node, version)
+    leaf_heap: List[Tuple] = []                   # (-f, depth, tie, node, version)
+    expanded = 0
+
+    def push(n: _SMANode):
+        n.version += 1
+        if n.key() < INF:
+            heapq.heappush(open_heap, (n.key(), -n.depth, next(tie), n, n.version))
+        if not n.children and n.parent is not None:
+            heapq.heappush(leaf_heap, (-n.f, n.depth, next(tie), n, n.version))
+
+    def backup(n: _SMANode):
+        """Re-derive f of *n* and its ancestors from their children."""
+        while n is not None and n.expanded:
+            values = [c.f for c in n.children.values()]
+            values.extend(n.forgotten.values())
+            new = min(values) if values else INF
+            if new == n.f:
+                push(n)                               # key may still have changed
+                return
+            n.f = new
+            push(n)
+            n = n.parent
+
+    def prune_worst(protect):
+        nonlocal used
+        skipped = []
+        try:
+            while leaf_heap:
+                entry = heapq.heappop(leaf_heap)
+                w, v = entry[3], entry[4]
+                if not w.alive or w.children or v != w.version:
+                    continue
+                if w in protect:
+                    skipped.append(entry)
+                    continue
+                p = w.parent
+                del p.children[w.state]
+                p.forgotten[w.state] = w.f
+                w.alive = False
+                used -= 1
+                backup(p)
+                return True
+            return False
+        finally:
+            for entry in skipped:
+                heapq.heappush(leaf_heap, entry)
+
+    def child_f(node: _SMANode, state, g_new, restored_f=None):
+        if node.depth + 1 >= budget - 1 and not goal_test(state):
+            return INF                                # no room to go deeper
+        if restored_f is not None:
+            return max(restored_f, g_new + heuristic(state))
+        return max(node.f, g_new + heuristic(state))  # pathmax
+
+    def add_child(node: _SMANode, act, state, g_new, f):
+        nonlocal used
+        child = _SMANode(state, node, act, g_new, f, node.depth + 1)
+        node.children[state] = child
+        used += 1
+        push(child)
+        return child
+
+    def ancestors(node: _SMANode):
+        seen = set()
+        while node is not None:
+            seen.add(node.state)
+            node = node.parent
+        return seen
+
+    def best_moves(node: _SMANode, wanted=None):
+        """Cheapest (action, cost) per successor state, skipping the current path."""
+        on_path = ancestors(node)
+        best = {}
+        for act, new_state, step_cost in successors(node.state):
+            if new_state in on_path or (wanted is not None and new_state != wanted):
+                continue
+            if new_state not in best or step_cost < best[new_state][1]:
+                best[new_state] = (act, step_cost)
+        return best
+
+    push(root)
+    while open_heap and root.f < INF:
+        key, _, _, node, v = heapq.heappop(open_heap)
+        if not node.alive or v != node.version:
+            continue
+
+        if not node.expanded:
+            if goal_test(node.state):
+                path = []
+                n = node
+                while n.parent is not None:
+                    path.append(n.action)
+                    n = n.parent
+                return path[::-1], node.g, expanded
+            expanded += 1
+            node.expanded = True
+            new = [(child_f(node, st, node.g + c), node.g + c, st, act)
+                   for st, (act, c) in best_moves(node).items()]
+        else:                                          # regenerate the best forgotten child
+            expanded += 1
+            st = min(node.forgotten, key=node.forgotten.get)
+            restored = node.forgotten.pop(st)
+            act, c = best_moves(node, st)[st]
+            new = [(child_f(node, st, node.g + c, restored), node.g + c, st, act)]
+
+        # add children best-first; when memory is full drop the worst leaf,
+        # never the node being expanded or its best child
+        new.sort(key=lambda t: t[0])
+        keep = {node}
+        for f, g_new, st, act in new:
+            child = add_child(node, act, st, g_new, f)
+            if len(keep) == 1:
+                keep.add(child)
+            while used > budget and prune_worst(keep):
+                pass
+        backup(node)
+        push(node)
+
+    return [], INF, expanded
+
+
 # ── Vacuum‑world domain (4 squares linear: A‑B‑C‑D) ───────────────────────── #
 POSITIONS = ["A", "B", "C", "D"]
 
 
+def configure(squares: int) -> None:
+    """Resize the corridor to *squares* squares (A, B, …; S0, S1, … past 26)."""
+    global POSITIONS
+    POSITIONS = [chr(ord("A") + i) if squares <= 26 else f"S{i}" for i in range(squares)]
+
+
 def vac_initial_state() -> Tuple:
     """Start at A, all squares dirty."""
-    return ("A", "Dirty", "Dirty", "Dirty", "Dirty")
+    return (POSITIONS[0],) + ("Dirty",) * len(POSITIONS)
 
 
 def vac_goal_test(state: Tuple) -> bool:
@@ -81,7 +338,7 @@ def vac_successors(state: Tuple) -> List[Tuple[str, Tuple, int]]:
         succ.append(("Suck", (loc, *new_statuses), 1))
 
     # Move Right
-    if idx < 3:
+    if idx < len(POSITIONS) - 1:
         succ.append(("Right", (POSITIONS[idx + 1], *statuses), 1))
 
     # Move Left
@@ -98,13 +355,30 @@ def vac_heuristic(state: Tuple) -> int:
 
 # ── quick demo ─────────────────────────────────────────────────────────────── #
 if __name__ == "__main__":
-    path, cost, expanded = a_star_search(
-        start_state=vac_initial_state(),
-        goal_test=vac_goal_test,
-        successors=vac_successors,
-        heuristic=vac_heuristic,
-    )
+    import argparse
+
+    parser = argparse.ArgumentParser(description="A* / IDA* / SMA* vacuum cleaner")
+    parser.add_argument("--squares", type=int, default=len(POSITIONS))
+    parser.add_argument("--mode", choices=("astar", "ida", "sma"), default="astar")
+    parser.add_argument("--budget", type=int, default=100_000, help="SMA* node budget")
+    args = parser.parse_args()
+    configure(args.squares)
+
+    problem = dict(start_state=vac_initial_state(), goal_test=vac_goal_test,
+                   successors=vac_successors, heuristic=vac_heuristic)
+    stats: Dict[str, int] = {}
+    if args.mode == "astar":
+        path, cost, expanded = a_star_search(**problem, stats=stats)
+    elif args.mode == "ida":
+        path, cost, expanded = ida_star_search(**problem)
+    else:
+        path, cost, expanded = sma_star_search(**problem, budget=args.budget)
 
     print("Solution path :", " -> ".join(path))
     print("Total cost    :", cost)
-    print("Nodes expanded:", expanded)
+    if stats:
+        print("Nodes expanded:", expanded,
+              f"(pushes {stats['pushes']}, stale pops {stats['stale_pops']}, "
+              f"re-expansions {stats['reexpansions']})")
+    else:
+        print("Nodes expanded:", expanded)
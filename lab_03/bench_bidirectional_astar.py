@@ -0,0 +1,65 @@
+"""
+Lab 03 ▸ Benchmark — A* vs Bidirectional A* on generated grid graphs
+====================================================================
+W×W 4-connected grid, random integer edge weights in [1, 9] (same weight
+both directions), start = top-left, goal = bottom-right.  Heuristics are
+Manhattan distances (× min weight 1 ⇒ consistent): h_f to the goal, h_r
+from the start.
+
+Columns: expansions / seconds of `INFORMED_SEARCH` (A*) and of
+`BIDIRECTIONAL_ASTAR` with h_r = 0 and with h_r = Manhattan-from-start.
+
+Run:
+    python bench_bidirectional_astar.py
+    python bench_bidirectional_astar.py --sizes 100 300 1000
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from informed_search import BIDIRECTIONAL_ASTAR, INFORMED_SEARCH, CSRGraph
+
+
+def grid_graph(width: int, seed: int = 0):
+    """Returns (csr with h = Manhattan to the far corner, Manhattan from the origin)."""
+    rng = np.random.default_rng(seed)
+    ids = np.arange(width * width).reshape(width, width)
+    a = np.concatenate([ids[:, :-1].ravel(), ids[:-1, :].ravel()])
+    b = np.concatenate([ids[:, 1:].ravel(), ids[1:, :].ravel()])
+    w = rng.integers(1, 10, len(a))
+    r, c = np.divmod(np.arange(width * width), width)
+    h_goal = ((width - 1 - r) + (width - 1 - c)).astype(np.float64)
+    csr = CSRGraph.from_edges(list(range(width * width)), np.concatenate([a, b]),
+                              np.concatenate([b, a]), np.concatenate([w, w]), h_goal)
+    return csr, (r + c).astype(np.float64)
+
+
+def timed(fn, *args, **kwargs):
+    t0 = time.perf_counter()
+    out = fn(*args, **kwargs)
+    return out, time.perf_counter() - t0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="A* vs bidirectional A*")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[50, 100, 200, 400])
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    print(f"{'W':>5} {'cost':>7} | {'A* exp':>9} {'s':>6} | {'bi h_r=0 (f+r)':>20} {'s':>6} "
+          f"| {'bi h_r=M (f+r)':>20} {'s':>6}")
+    for width in args.sizes:
+        csr, h_start = grid_graph(width, args.seed)
+        goal = [width * width - 1]
+        csr.reverse()                                   # one-off, not timed
+        uni, bi0, bim = {}, {}, {}
+        p1, t1 = timed(INFORMED_SEARCH, 0, csr=csr, goal_states=goal, stats=uni)
+        p2, t2 = timed(BIDIRECTIONAL_ASTAR, 0, csr, goal, None, bi0)
+        p3, t3 = timed(BIDIRECTIONAL_ASTAR, 0, csr, goal, h_start, bim)
+        cost = p1[-1].PATH_COST
+        assert cost == p2[-1].PATH_COST == p3[-1].PATH_COST, "bidirectional path is not shortest"
+        f0 = f"{bi0['forward']}+{bi0['reverse']}"
+        fm = f"{bim['forward']}+{bim['reverse']}"
+        print(f"{width:5} {cost:7} | {uni['expanded']:9} {t1:6.2f} | {f0:>20} {t2:6.2f} | {fm:>20} {t3:6.2f}")
@@ -1,4 +1,44 @@
+"""
+Lab 03 ▸ Informed Search — Greedy Best-First vs A*
+==================================================
+Takeaways:
+    • `graph` (nested dicts) is the readable source; searches run on a
+      `CSRGraph`: NumPy offsets / targets / weights arrays + an `h` array,
+      nodes addressed by integer id ⇒ road-network-sized graphs fit in RAM.
+    • `load_edge_list()` builds one from a `src,dst[,weight]` CSV (optional
+      `node,h` heuristic file).
+    • ARA_STAR is an anytime generator: weighted A* whose weight drops by
+      `f_step` per iteration, reusing g-values through an INCONS list; it
+      yields (path, cost, suboptimality bound) and honours `deadline_ms`.
+    • BIDIRECTIONAL_ASTAR meets in the middle: reverse CSR built once
+      (`CSRGraph.reverse()`), average potentials (h_f − h_r)/2, multi-goal
+      ⇒ multi-source reverse search, per-side expansion counts.
+      Benchmark: `bench_bidirectional_astar.py`.
+    • Many queries on one graph ⇒ `landmarks.py` (ALT heuristics, `query_many`).
+    • INFORMED_SEARCH keeps g / parent in id-indexed arrays and pushes
+      (f, tie, g, id, parent) tuples – no Node per neighbour.  Nodes are
+      only built for the returned path, and for observers only when they
+      read them (the fringe is a lazy `_FringeView`).
+    • Equal-f entries are *not* broken by g or insertion order: `_Tie()`
+      never compares less, so the heap's sift order decides – exactly as
+      the lab's (f, Node) tuples did, keeping the printed trace unchanged.
+
+Run:
+    python informed_search.py
+    python informed_search.py --edges roads.csv --h roads_h.csv --start 0 --goal 999
+"""
+
+import csv
 import heapq
+import sys
+import time
+from array import array
+from pathlib import Path
+
+import numpy as np
+
+sys.path.append(str(Path(__file__).resolve().parent.parent / 'lab_02'))
+from search_hooks import SearchObserver  # shared observer protocol (lab_02)
 
 graph = {
     'A': {'neighbors': {'B': 1, 'C': 2, 'D': 4}, 'h': 6},
@@ -49,65 +89,441 @@ class Node:
         return self.TOTAL_COST < other.TOTAL_COST
 
 
-def EXPAND(node, algorithm='astar', f_weight=1.0):
+class CSRGraph:
+    """
+    Compressed-sparse-row adjacency: the neighbours of node u are
+    targets[offsets[u]:offsets[u+1]] with matching weights.  `names` maps
+    id → label and `index` label → id.
+    """
+
+    def __init__(self, names, offsets, targets, weights, h):
+        self.names = list(names)
+        self.index = {name: i for i, name in enumerate(self.names)}
+        self.offsets, self.targets, self.weights, self.h = offsets, targets, weights, h
+
+    def __len__(self):
+        return len(self.names)
+
+    def reverse(self):
+        """Transposed graph (edge v → u per u → v), built once and cached."""
+        if getattr(self, '_reverse', None) is None:
+            src = np.repeat(np.arange(len(self.names)), np.diff(self.offsets))
+            rev = CSRGraph.from_edges(self.names, self.targets, src, self.weights, self.h)
+            rev.weights = rev.weights.astype(self.weights.dtype)
+            rev.index, rev._reverse = self.index, self
+            self._reverse = rev
+        return self._reverse
+
+    def neighbors(self, u):
+        """(targets, weights) of *u* as Python lists."""
+        a, b = self.offsets[u], self.offsets[u + 1]
+        return self.targets[a:b].tolist(), self.weights[a:b].tolist()
+
+    @classmethod
+    def from_dict(cls, graph):
+        """Nested-dict graph → CSR, keeping neighbour order (dtypes follow the data)."""
+        names = list(graph)
+        index = {name: i for i, name in enumerate(names)}
+        degrees = [len(graph[name]['neighbors']) for name in names]
+        offsets = np.zeros(len(names) + 1, dtype=np.int64)
+        np.cumsum(degrees, out=offsets[1:])
+        targets = np.array([index[v] for name in names for v in graph[name]['neighbors']], dtype=np.int64)
+        weights = np.array([w for name in names for w in graph[name]['neighbors'].values()])
+        h = np.array([graph[name]['h'] for name in names])
+        return cls(names, offsets, targets, weights, h)
+
+    @classmethod
+    def from_edges(cls, names, src, dst, weights, h=None):
+        """Id arrays (any order) → CSR; edges of one source keep their file order."""
+        src = np.asarray(src, dtype=np.int64)
+        order = np.argsort(src, kind='stable')
+        offsets = np.zeros(len(names) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(src, minlength=len(names)), out=offsets[1:])
+        h = np.zeros(len(names)) if h is None else np.asarray(h, dtype=np.float64)
+        return cls(names, offsets, np.asarray(dst, dtype=np.int64)[order],
+                   np.asarray(weights, dtype=np.float64)[order], h)
+
+
+def load_edge_list(path, heuristic_path=None, undirected=False, delimiter=','):
     """
-    Expands a node by generating its successors.
+    Read `src,dst[,weight]` rows (weight defaults to 1; '#' lines and a
+    non-numeric header row are skipped) and optional `node,h` rows.
     """
-    successors = []
-    neighbor_data = graph[node.STATE]['neighbors']
+    index, names = {}, []
 
-    for neighbor, cost in neighbor_data.items():
-        new_path_cost = node.PATH_COST + cost
-        heuristic = graph[neighbor]['h']
-        s = Node(
-            state=neighbor,
-            parent=node,
-            path_cost=new_path_cost,
-            heuristic=heuristic,
-            f_weight=f_weight if algorithm == 'astar' else 0
-        )
-        successors.append(s)
+    def node_id(label):
+        i = index.get(label)
+        if i is None:
+            i = index[label] = len(names)
+            names.append(label)
+        return i
 
-    # Print a summary of the expansion
-    child_states = ", ".join(child.STATE for child in successors)
-    print(f"Expanding '{node.STATE}' -> Children: [{child_states}]")
-    return successors
+    src, dst, weights = array('q'), array('q'), array('d')
+    with open(path, newline='') as f:
+        for row_no, row in enumerate(csv.reader(f, delimiter=delimiter)):
+            if not row or row[0].startswith('#'):
+                continue
+            try:
+                w = float(row[2]) if len(row) > 2 else 1.0
+            except ValueError:
+                if row_no == 0:
+                    continue                          # header
+                raise
+            u, v = node_id(row[0].strip()), node_id(row[1].strip())
+            src.append(u); dst.append(v); weights.append(w)
+            if undirected:
+                src.append(v); dst.append(u); weights.append(w)
 
+    h = np.zeros(len(names))
+    if heuristic_path is not None:
+        with open(heuristic_path, newline='') as f:
+            for row in csv.reader(f, delimiter=delimiter):
+                if not row or row[0].startswith('#') or row[0].strip() not in index:
+                    continue
+                try:
+                    h[index[row[0].strip()]] = float(row[1])
+                except ValueError:
+                    continue                          # header
+    return CSRGraph.from_edges(names, np.frombuffer(src, dtype=np.int64),
+                               np.frombuffer(dst, dtype=np.int64),
+                               np.frombuffer(weights, dtype=np.float64), h)
 
-def INFORMED_SEARCH(start_state='A', algorithm='astar', f_weight=1.0):
+
+CSR = CSRGraph.from_dict(graph)
+
+
+class TraceObserver(SearchObserver):
     """
-    Performs either Greedy Best-First Search or A* Search.
+    Prints the expansion / fringe trace of the original lab output.
     """
-    priority_queue = []
-    explored = set()
 
-    h_value = graph[start_state]['h']
-    initial_node = Node(state=start_state, heuristic=h_value, f_weight=f_weight if algorithm == 'astar' else 0)
-    heapq.heappush(priority_queue, (initial_node.TOTAL_COST, initial_node))
+    def __init__(self):
+        self.expanded = 0
+
+    def on_expand(self, node, children, fringe):
+        self.expanded += 1
+        child_states = ", ".join(child.STATE for child in children)
+        print(f"Expanding '{node.STATE}' -> Children: [{child_states}]")
+        current_fringe = ", ".join(n[1].STATE for n in fringe)
+        print(f"Current Fringe: [{current_fringe}]\n")
 
-    nodes_expanded = 0
+    def on_goal(self, node):
+        print(f"Goal '{node.STATE}' reached after expanding {self.expanded} node(s).")
+
+
+def _path_nodes(csr, parent, g, goal, f_weight):
+    """Node chain for the solution only (what callers / format_path expect)."""
+    ids = []
+    while goal >= 0:
+        ids.append(goal)
+        goal = parent[goal]
+    node = None
+    for i in reversed(ids):
+        cost = g[i].astype(csr.weights.dtype).item()     # float g ⇒ int costs stay int
+        node = Node(csr.names[i], node, cost, csr.h[i].item(), f_weight)
+    return node.path()
+
+
+def _node(csr, entry, f_weight):
+    """Heap entry → throw-away Node, built only for observers."""
+    _, _, cost, i, _ = entry
+    return Node(csr.names[i], None, cost, csr.h[i].item(), f_weight)
+
+
+def _goal_ids(csr, goal_states):
+    """Goal labels → ids; None = built-in GOAL_STATES.  Unknown labels raise ValueError."""
+    labels = GOAL_STATES if goal_states is None else goal_states
+    missing = [s for s in labels if s not in csr.index]
+    if missing:
+        raise ValueError(f"goal state(s) {missing} not in the graph"
+                         + (" (pass goal_states for a loaded graph)" if goal_states is None else ""))
+    return [csr.index[s] for s in labels]
+
+
+class _Tie:
+    """
+    Second heap-tuple field.  A fresh instance is neither == nor < any other,
+    so equal-f entries stop comparing here and keep the heap's sift order
+    (the lab's Node.__lt__ was False on ties).  A FIFO counter or falling
+    through to g would reorder the recorded trace.
+    """
+
+    __slots__ = ()
+
+    def __eq__(self, other):
+        return False
+
+    def __lt__(self, other):
+        return False
+
+    __hash__ = object.__hash__
+
+
+class _FringeView:
+    """
+    Read-only (f, Node) sequence over the live heap.  `len()` is free; Nodes
+    are only built when an observer iterates or indexes, so counting
+    observers pay nothing.  Valid for the duration of the callback.
+    """
+
+    __slots__ = ("_heap", "_csr", "_f_weight")
+
+    def __init__(self, heap, csr, f_weight):
+        self._heap, self._csr, self._f_weight = heap, csr, f_weight
+
+    def __len__(self):
+        return len(self._heap)
+
+    def __getitem__(self, i):
+        e = self._heap[i]
+        return e[0], _node(self._csr, e, self._f_weight)
+
+    def __iter__(self):
+        for e in self._heap:
+            yield e[0], _node(self._csr, e, self._f_weight)
+
+    def __repr__(self):
+        return repr(list(self))
+
+
+def INFORMED_SEARCH(start_state='A', algorithm='astar', f_weight=1.0, observer=None,
+                    csr=None, goal_states=None, stats=None):
+    """
+    Performs either Greedy Best-First Search or A* Search on *csr*
+    (default: the built-in `graph`).  States are labels at the interface,
+    integer ids inside.  Returns the path as a list of Nodes, or None.
+    *observer* receives `search_hooks` events (None = silent, no overhead);
+    *stats*, if a dict, receives the 'expanded' count.
+    """
+    csr = CSR if csr is None else csr
+    weight = f_weight if algorithm == 'astar' else 0
+    goals = np.zeros(len(csr), dtype=bool)
+    goals[_goal_ids(csr, goal_states)] = True
+    offsets, targets, weights, h = csr.offsets, csr.targets, csr.weights, csr.h
+    g = np.zeros(len(csr), dtype=weights.dtype)
+    parent = np.full(len(csr), -1, dtype=np.int64)
+    explored = np.zeros(len(csr), dtype=bool)
+
+    start = csr.index[start_state]
+    h0 = h[start].item()
+    priority_queue = [(h0 if weight == 0 else weight * h0, _Tie(), 0, start, -1)]
+    view = _FringeView(priority_queue, csr, weight)
+
+    expanded = 0
 
     while priority_queue:
-        _, node = heapq.heappop(priority_queue)
+        entry = heapq.heappop(priority_queue)
+        _, _, cost, u, p = entry
+        if observer is not None:
+            observer.on_select(_node(csr, entry, weight), view)
 
         # When a goal is found, return the full path
-        if node.STATE in GOAL_STATES:
-            print(f"Goal '{node.STATE}' reached after expanding {nodes_expanded} node(s).")
-            return node.path()
-
-        if node.STATE not in explored:
-            explored.add(node.STATE)
-            nodes_expanded += 1
-            children = EXPAND(node, algorithm, f_weight)
-            for child in children:
-                heapq.heappush(priority_queue, (child.TOTAL_COST, child))
-            # Print the current fringe (states only)
-            current_fringe = ", ".join(n[1].STATE for n in priority_queue)
-            print(f"Current Fringe: [{current_fringe}]\n")
+        if goals[u]:
+            g[u], parent[u] = cost, p
+            if stats is not None:
+                stats['expanded'] = expanded
+            path = _path_nodes(csr, parent, g, u, weight)
+            if observer is not None:
+                observer.on_goal(path[-1])
+            return path
 
+        if not explored[u]:
+            explored[u], g[u], parent[u] = True, cost, p
+            expanded += 1
+            a, b = offsets[u], offsets[u + 1]
+            vs = targets[a:b].tolist()
+            for v, w, hv in zip(vs, weights[a:b].tolist(), h[targets[a:b]].tolist()):
+                c = cost + w
+                heapq.heappush(priority_queue, (hv if weight == 0 else c + weight * hv, _Tie(), c, v, u))
+            if observer is not None:
+                children = [_node(csr, (None, None, cost + w, v, None), weight)
+                            for v, w in zip(vs, weights[a:b].tolist())]
+                observer.on_expand(_node(csr, entry, weight), children, view)
+        elif observer is not None:
+            observer.on_duplicate(_node(csr, entry, weight))
+
+    if stats is not None:
+        stats['expanded'] = expanded
     return None
 
 
+def ARA_STAR(start_state='A', f_weight=3.0, f_step=0.5, deadline_ms=None,
+             csr=None, goal_states=None):
+    """
+    Anytime Repairing A*: weighted A* with weight ε = *f_weight*, lowered by
+    *f_step* towards 1 after every solution.  States whose g improved after
+    they were closed wait in INCONS and re-enter OPEN at the next ε, so
+    each iteration repairs the previous search instead of restarting.
+
+    Yields (path, cost, bound) – path as a list of Nodes, bound = proven
+    suboptimality factor (cost ≤ bound · optimal); the last yield has
+    bound 1 unless *deadline_ms* (wall clock, from the first call) cuts
+    the search short.
+    """
+    csr = CSR if csr is None else csr
+    deadline = None if deadline_ms is None else time.perf_counter() + deadline_ms / 1000
+    goal_ids = np.array(_goal_ids(csr, goal_states))
+    offsets, targets, weights, h = csr.offsets, csr.targets, csr.weights, csr.h
+    g = np.full(len(csr), np.inf)
+    parent = np.full(len(csr), -1, dtype=np.int64)
+    closed = np.zeros(len(csr), dtype=bool)
+    start = csr.index[start_state]
+    g[start] = 0.0
+    eps = max(1.0, f_weight)
+    open_ids, incons = {start}, set()
+    heap = [(eps * h[start].item(), 0.0, start)]
+
+    def best_goal():
+        i = goal_ids[np.argmin(g[goal_ids])]
+        return i, g[i].item()
+
+    def improve_path():
+        """Expand OPEN until no state can beat the best goal's f; False on timeout."""
+        goal, goal_g = best_goal()
+        goal_f = goal_g + eps * h[goal].item()
+        while heap:
+            key, gs, u = heap[0]
+            if u not in open_ids or gs != g[u]:
+                heapq.heappop(heap)                   # stale entry
+                continue
+            if key >= goal_f:
+                break
+            if deadline is not None and time.perf_counter() > deadline:
+                return False
+            heapq.heappop(heap)
+            open_ids.discard(u)
+            closed[u] = True
+            a, b = offsets[u], offsets[u + 1]
+            for v, w, hv in zip(targets[a:b].tolist(), weights[a:b].tolist(), h[targets[a:b]].tolist()):
+                c = gs + w
+                if c < g[v]:
+                    g[v], parent[v] = c, u
+                    if closed[v]:
+                        incons.add(v)
+                    else:
+                        open_ids.add(v)
+                        heapq.heappush(heap, (c + eps * hv, c, v))
+            goal, goal_g = best_goal()
+            goal_f = goal_g + eps * h[goal].item()
+        return True
+
+    def bound(goal_g, proven):
+        """min(ε of the last completed iteration, g(goal) / min over OPEN ∪ INCONS of g + h)."""
+        pending = list(open_ids | incons)
+        if not pending:
+            return 1.0
+        lower = (g[pending] + h[pending]).min()
+        return min(proven, goal_g / lower) if lower > 0 else proven
+
+    last = (np.inf, np.inf)
+    while True:
+        finished = improve_path()
+        goal, goal_g = best_goal()
+        if goal_g < np.inf:
+            eps_bound = max(1.0, bound(goal_g, eps if finished else last[1]))
+            if (goal_g, eps_bound) < last:            # only report improvements
+                last = (goal_g, eps_bound)
+                path = _path_nodes(csr, parent, g, goal, eps)
+                yield path, path[-1].PATH_COST, eps_bound
+            if eps_bound <= 1.0:
+                return
+        if not finished or (eps <= 1.0 and goal_g == np.inf):
+            return
+        # next iteration: lower ε, move INCONS into OPEN, re-key, reopen CLOSED
+        eps = max(1.0, eps - f_step)
+        open_ids |= incons
+        incons.clear()
+        closed[:] = False
+        heap = [(g[u].item() + eps * h[u].item(), g[u].item(), u) for u in open_ids]
+        heapq.heapify(heap)
+
+
+def BIDIRECTIONAL_ASTAR(start_state='A', csr=None, goal_states=None, h_reverse=None, stats=None):
+    """
+    Bidirectional A* for point-to-point queries.  Forward search on *csr*,
+    reverse search on `csr.reverse()` started from *all* goals at once
+    (multi-goal ⇒ multi-source).  Average potentials keep both sides
+    consistent:
+        p_f(v) = (h_f(v) − h_r(v)) / 2,   p_r(v) = −p_f(v)
+    with h_f = csr.h (to the goals) and h_r = *h_reverse* (from the start,
+    default 0).  Keys are g + p; stop once  min k_f + min k_r ≥ μ  (best
+    meeting cost).  Both heuristics must be consistent.
+    Returns the path as a list of Nodes, or None; *stats* receives the
+    'forward' / 'reverse' expansion counts.
+    """
+    csr = CSR if csr is None else csr
+    rev = csr.reverse()
+    n = len(csr)
+    h_r = np.zeros(n) if h_reverse is None else np.asarray(h_reverse, dtype=np.float64)
+    p_f = ((csr.h - h_r) / 2).tolist()
+    start = csr.index[start_state]
+    goal_ids = _goal_ids(csr, goal_states)
+
+    # side 0 = forward (start → goals), side 1 = reverse (goals → start)
+    g = [np.full(n, np.inf), np.full(n, np.inf)]
+    parent = [np.full(n, -1, dtype=np.int64), np.full(n, -1, dtype=np.int64)]
+    edge_w = [np.zeros(n, dtype=csr.weights.dtype), np.zeros(n, dtype=csr.weights.dtype)]
+    closed = [np.zeros(n, dtype=bool), np.zeros(n, dtype=bool)]
+    adjacency = [(csr.offsets, csr.targets, csr.weights), (rev.offsets, rev.targets, rev.weights)]
+    sign = (1.0, -1.0)
+    heaps = [[], []]
+    g[0][start] = 0.0
+    heaps[0].append((p_f[start], 0.0, start))
+    for t in goal_ids:
+        g[1][t] = 0.0
+        heaps[1].append((-p_f[t], 0.0, t))
+    heapq.heapify(heaps[1])
+    expanded = [0, 0]
+    mu, meet = (0.0, start) if start in goal_ids else (np.inf, -1)
+
+    def top(side):
+        heap = heaps[side]
+        while heap and (closed[side][heap[0][2]] or heap[0][1] != g[side][heap[0][2]]):
+            heapq.heappop(heap)                       # stale entry
+        return heap[0][0] if heap else np.inf
+
+    while True:
+        kf, kr = top(0), top(1)
+        if kf + kr >= mu or kf == np.inf or kr == np.inf:
+            break
+        side = 0 if kf <= kr else 1
+        other = 1 - side
+        _, gu, u = heapq.heappop(heaps[side])
+        closed[side][u] = True
+        expanded[side] += 1
+        offsets, targets, weights = adjacency[side]
+        a, b = offsets[u], offsets[u + 1]
+        gs, go, par, pw, sgn = g[side], g[other], parent[side], edge_w[side], sign[side]
+        for v, w in zip(targets[a:b].tolist(), weights[a:b].tolist()):
+            c = gu + w
+            if c < gs[v]:
+                gs[v], par[v], pw[v] = c, u, w
+                heapq.heappush(heaps[side], (c + sgn * p_f[v], c, v))
+                total = c + go[v]
+                if total < mu:
+                    mu, meet = total, v
+
+    if stats is not None:
+        stats['forward'], stats['reverse'] = expanded
+    if meet < 0:
+        return None
+    # start → meet along forward parents, then meet → goal along reverse parents
+    chain, u = [], meet
+    while u >= 0:
+        chain.append((u, edge_w[0][u].item()))
+        u = parent[0][u]
+    chain.reverse()                                   # (id, weight of edge into id)
+    u = meet
+    while parent[1][u] >= 0:
+        chain.append((parent[1][u].item(), edge_w[1][u].item()))
+        u = parent[1][u]
+    node, cost = None, 0
+    for i, w in chain:
+        cost = 0 if node is None else cost + w
+        node = Node(csr.names[i], node, cost, csr.h[i].item())
+    return node.path()
+
+
 def format_path(path):
     """
     Formats the final path and total cost for pretty printing.
@@ -124,7 +540,7 @@ def run_comparison():
     print("-" * 50)
     print(" GREEDY BEST-FIRST SEARCH ".center(50, "-"))
     print("-" * 50)
-    greedy_path = INFORMED_SEARCH(algorithm='greedy')
+    greedy_path = INFORMED_SEARCH(algorithm='greedy', observer=TraceObserver())
     if greedy_path:
         path_str, total_cost = format_path(greedy_path)
         print("Path Found: " + path_str)
@@ -135,7 +551,7 @@ def run_comparison():
     print("\n" + "-" * 50)
     print("    A* SEARCH    ".center(50, "-"))
     print("-" * 50)
-    astar_path = INFORMED_SEARCH(algorithm='astar')
+    astar_path = INFORMED_SEARCH(algorithm='astar', observer=TraceObserver())
     if astar_path:
         path_str, total_cost = format_path(astar_path)
         print("Path Found: " + path_str)
@@ -145,4 +561,45 @@ def run_comparison():
 
 
 if __name__ == '__main__':
-    run_comparison()
\ No newline at end of file
+    import argparse
+    parser = argparse.ArgumentParser(description="Greedy / A* on the lab graph or an edge-list file")
+    parser.add_argument('--edges', help='CSV of src,dst[,weight] rows (default: built-in graph)')
+    parser.add_argument('--h', help='CSV of node,h rows')
+    parser.add_argument('--undirected', action='store_true', help='add every edge in both directions')
+    parser.add_argument('--start')
+    parser.add_argument('--goal', nargs='+')
+    parser.add_argument('--algorithm', choices=('astar', 'greedy', 'ara', 'bidirectional'), default='astar')
+    parser.add_argument('--f-weight', type=float, help='A* weight (default 1) / ARA* start weight (default 3)')
+    parser.add_argument('--f-step', type=float, default=0.5, help='ARA* weight decrement')
+    parser.add_argument('--deadline-ms', type=float, help='ARA* time budget')
+    args = parser.parse_args()
+    if args.edges is not None and not args.goal:
+        parser.error("--edges needs --goal (the built-in goals K, L are not in a loaded graph)")
+    if args.edges is None and args.start is None and args.algorithm in ('astar', 'greedy'):
+        run_comparison()
+    else:
+        t0 = time.perf_counter()
+        csr = CSR if args.edges is None else load_edge_list(args.edges, args.h, args.undirected)
+        start = args.start or csr.names[0]
+        t1 = time.perf_counter()
+        if args.algorithm == 'ara':
+            for path, cost, bound in ARA_STAR(start, args.f_weight or 3.0, args.f_step, args.deadline_ms,
+                                              csr, args.goal):
+                print(f"{(time.perf_counter() - t1) * 1000:9.1f} ms | cost {cost} | bound {bound:.3f} | "
+                      f"{len(path) - 1} edges")
+        else:
+            stats = {}
+            if args.algorithm == 'bidirectional':
+                path = BIDIRECTIONAL_ASTAR(start, csr, args.goal, stats=stats)
+            else:
+                path = INFORMED_SEARCH(start, args.algorithm, args.f_weight or 1.0, csr=csr,
+                                       goal_states=args.goal, stats=stats)
+            t2 = time.perf_counter()
+            print(f"Loaded {len(csr)} nodes / {len(csr.targets)} edges in {t1 - t0:.2f}s; "
+                  f"search {t2 - t1:.2f}s; expanded {stats}")
+            if path:
+                path_str, total_cost = format_path(path)
+                print("Path Found: " + path_str)
+                print("Total Cost: " + str(total_cost))
+            else:
+                print("No solution found")
\ No newline at end of file
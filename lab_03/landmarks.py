@@ -0,0 +1,201 @@
+"""
+Lab 03 ▸ ALT — A* with Landmarks & the Triangle Inequality
+==========================================================
+Takeaways:
+    • Preprocess once per graph: pick K landmarks by *farthest-point*
+      selection, run Dijkstra from each (d_from[v, L] = d(L, v)) and on the
+      reverse graph to each (d_to[v, L] = d(v, L)).  Arrays are (n, K) so the
+      K values of one node are contiguous; `save()` / `load()` use `.npz`.
+    • For any goal t the triangle inequality gives an admissible, consistent
+          h(v) = max_L max(d(v, L) − d(t, L),  d(L, t) − d(L, v))
+      evaluated lazily – only for nodes the search actually touches.
+    • `query_many(pairs)` answers a batch of (start, goal) queries against
+      the same precomputation; the lab `'h'` values are not needed.
+
+Run:
+    python landmarks.py                              # 200×200 grid, 8 landmarks
+    python landmarks.py --width 300 --landmarks 16 --queries 50 --npz grid_alt.npz
+    python landmarks.py --edges roads.csv --undirected --queries 20
+"""
+
+import argparse
+import heapq
+import os
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from informed_search import CSRGraph, load_edge_list
+
+
+def dijkstra(csr: CSRGraph, sources: Iterable[int]) -> np.ndarray:
+    """Multi-source shortest distances from *sources* (inf = unreachable)."""
+    dist = np.full(len(csr), np.inf)
+    offsets, targets, weights = csr.offsets, csr.targets, csr.weights
+    heap = []
+    for s in sources:
+        dist[s] = 0.0
+        heap.append((0.0, s))
+    heapq.heapify(heap)
+    while heap:
+        d, u = heapq.heappop(heap)
+        if d > dist[u]:
+            continue                                  # stale entry
+        a, b = offsets[u], offsets[u + 1]
+        for v, w in zip(targets[a:b].tolist(), weights[a:b].tolist()):
+            nd = d + w
+            if nd < dist[v]:
+                dist[v] = nd
+                heapq.heappush(heap, (nd, v))
+    return dist
+
+
+def astar_ids(csr: CSRGraph, start: int, goal: int, h: Callable[[int], float],
+              stats: Optional[Dict[str, int]] = None) -> Tuple[List[int], float]:
+    """A* on integer ids with a callable heuristic; returns (ids, cost) or ([], inf)."""
+    offsets, targets, weights = csr.offsets, csr.targets, csr.weights
+    g: Dict[int, float] = {start: 0.0}
+    parent: Dict[int, int] = {start: -1}
+    closed = set()
+    heap = [(h(start), 0.0, start)]
+    expanded = 0
+    while heap:
+        _, gu, u = heapq.heappop(heap)
+        if u in closed or gu > g[u]:
+            continue                                  # stale entry
+        if u == goal:
+            path = []
+            while u >= 0:
+                path.append(u)
+                u = parent[u]
+            if stats is not None:
+                stats['expanded'] = expanded
+            return path[::-1], gu
+        closed.add(u)
+        expanded += 1
+        a, b = offsets[u], offsets[u + 1]
+        for v, w in zip(targets[a:b].tolist(), weights[a:b].tolist()):
+            c = gu + w
+            if c < g.get(v, np.inf):
+                hv = h(v)
+                if hv == np.inf:
+                    continue                          # provably cannot reach goal
+                g[v], parent[v] = c, u
+                heapq.heappush(heap, (c + hv, c, v))
+    if stats is not None:
+        stats['expanded'] = expanded
+    return [], np.inf
+
+
+class Landmarks:
+    """Landmark distance tables for one graph."""
+
+    def __init__(self, csr: CSRGraph, ids: np.ndarray, d_from: np.ndarray, d_to: np.ndarray):
+        self.csr, self.ids, self.d_from, self.d_to = csr, ids, d_from, d_to
+
+    # ── preprocessing ───────────────────────────────────────────────────────
+    @classmethod
+    def build(cls, csr: CSRGraph, k: int = 8, first: int = 0) -> "Landmarks":
+        """Farthest-point selection: each new landmark maximises the distance to the chosen ones."""
+        rev = csr.reverse()
+        n, k = len(csr), min(k, len(csr))
+        d_from, d_to = np.empty((n, k)), np.empty((n, k))
+        nearest = np.full(n, np.inf)                  # distance to the closest landmark so far
+        ids = []
+        u = first
+        for i in range(k):
+            ids.append(u)
+            d_from[:, i] = dijkstra(csr, [u])
+            d_to[:, i] = dijkstra(rev, [u])
+            nearest = np.minimum(nearest, np.minimum(d_from[:, i], d_to[:, i]))
+            finite = np.where(np.isfinite(nearest), nearest, -1.0)
+            finite[ids] = -1.0
+            u = int(finite.argmax())
+            if finite[u] <= 0:                        # every reachable node already a landmark
+                d_from, d_to = d_from[:, :i + 1], d_to[:, :i + 1]
+                break
+        return cls(csr, np.array(ids, dtype=np.int64), d_from, d_to)
+
+    def save(self, path: str) -> None:
+        np.savez(path, ids=self.ids, d_from=self.d_from, d_to=self.d_to, n=len(self.csr))
+
+    @classmethod
+    def load(cls, path: str, csr: CSRGraph) -> "Landmarks":
+        with np.load(path) as data:
+            if int(data['n']) != len(csr):
+                raise ValueError(f"{path}: built for {int(data['n'])} nodes, graph has {len(csr)}")
+            return cls(csr, data['ids'], data['d_from'], data['d_to'])
+
+    # ── queries ─────────────────────────────────────────────────────────────
+    def heuristic(self, goal: int) -> Callable[[int], float]:
+        """Lazy, memoised triangle-inequality bound towards *goal*."""
+        to_goal, from_goal = self.d_to[goal], self.d_from[goal]
+        d_to, d_from = self.d_to, self.d_from
+        cache: Dict[int, float] = {}
+
+        def h(v: int) -> float:
+            hv = cache.get(v)
+            if hv is None:
+                with np.errstate(invalid='ignore'):
+                    bounds = np.concatenate((d_to[v] - to_goal, from_goal - d_from[v]))
+                bounds = bounds[~np.isnan(bounds)]    # inf − inf: landmark says nothing
+                hv = cache[v] = max(0.0, bounds.max()) if bounds.size else 0.0
+            return hv
+        return h
+
+    def query(self, start, goal) -> Tuple[List, float, int]:
+        """Labels in, (path labels, cost, expanded) out."""
+        index, names = self.csr.index, self.csr.names
+        stats: Dict[str, int] = {}
+        ids, cost = astar_ids(self.csr, index[start], index[goal], self.heuristic(index[goal]), stats)
+        return [names[i] for i in ids], cost, stats['expanded']
+
+    def query_many(self, pairs: Iterable[Tuple]) -> List[Tuple[List, float, int]]:
+        """Answer every (start, goal) pair with the same landmark tables."""
+        return [self.query(s, t) for s, t in pairs]
+
+
+if __name__ == "__main__":
+    import random
+
+    from bench_bidirectional_astar import grid_graph
+
+    parser = argparse.ArgumentParser(description="ALT preprocessing + batched queries")
+    parser.add_argument("--edges", help="CSV of src,dst[,weight] rows (default: generated grid)")
+    parser.add_argument("--undirected", action="store_true")
+    parser.add_argument("--width", type=int, default=200, help="grid width when no --edges")
+    parser.add_argument("--landmarks", type=int, default=8)
+    parser.add_argument("--queries", type=int, default=20)
+    parser.add_argument("--npz", help="landmark file: loaded if present, else written")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    csr = load_edge_list(args.edges, undirected=args.undirected) if args.edges else grid_graph(args.width, args.seed)[0]
+    t0 = time.perf_counter()
+    if args.npz and os.path.exists(args.npz):
+        alt = Landmarks.load(args.npz, csr)
+        how = "loaded"
+    else:
+        alt = Landmarks.build(csr, args.landmarks)
+        how = "built"
+        if args.npz:
+            alt.save(args.npz)
+    print(f"{len(alt.ids)} landmarks {how} in {time.perf_counter() - t0:.2f}s for {len(csr)} nodes")
+
+    rng = random.Random(args.seed)
+    pairs = [(rng.choice(csr.names), rng.choice(csr.names)) for _ in range(args.queries)]
+    t0 = time.perf_counter()
+    answers = alt.query_many(pairs)
+    t_alt = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    base = []
+    for s, t in pairs:                                # same A*, h = 0 ⇒ Dijkstra
+        stats: Dict[str, int] = {}
+        _, cost = astar_ids(csr, csr.index[s], csr.index[t], lambda v: 0.0, stats)
+        base.append((None, cost, stats['expanded']))
+    t_dij = time.perf_counter() - t0
+    assert all(a[1] == b[1] for a, b in zip(answers, base)), "ALT lost optimality"
+    print(f"{len(pairs)} queries | Dijkstra: {sum(b[2] for b in base) / len(pairs):9.0f} exp/query {t_dij:6.2f}s"
+          f" | ALT: {sum(a[2] for a in answers) / len(pairs):9.0f} exp/query {t_alt:6.2f}s")
@@ -0,0 +1,82 @@
+"""Regression tests for the memory-bounded modes of astar_vacuum_cleaner (run: pytest)."""
+
+import random
+
+import pytest
+
+import astar_vacuum_cleaner as av
+from astar_vacuum_cleaner import a_star_search, ida_star_search, sma_star_search
+
+INF = float("inf")
+
+
+def graph_problem(adj, goal, h=None):
+    """Start 0, adjacency lists of (target, cost); actions read 'u->v'."""
+    return (0,
+            lambda s: s == goal,
+            lambda s: [(f"{s}->{v}", v, c) for v, c in adj[s]],
+            (lambda s: 0) if h is None else h)
+
+
+def path_cost(adj, path):
+    total = 0
+    for act in path:
+        u, v = map(int, act.split("->"))
+        total += min(c for t, c in adj[u] if t == v)
+    return total
+
+
+def exact_distances(adj, goal):
+    """Cheapest cost from every node to *goal* (Bellman-Ford on the small graph)."""
+    d = [INF] * len(adj)
+    d[goal] = 0
+    for _ in adj:
+        for u, edges in enumerate(adj):
+            for v, c in edges:
+                d[u] = min(d[u], c + d[v])
+    return d
+
+
+def test_sma_keeps_forgotten_f_small_budget():
+    adj = [[(3, 3), (4, 6), (2, 8)], [], [(3, 7)], [(0, 6), (1, 8), (4, 1)], [(3, 4), (0, 2)]]
+    path, cost, _ = sma_star_search(*graph_problem(adj, 4), budget=4)
+    assert (path, cost) == (["0->3", "3->4"], 4)
+
+
+def test_sma_unreachable_goal_terminates():
+    adj = [[(1, 7), (3, 8), (2, 2)], [(2, 4), (3, 6), (1, 3)], [(1, 8), (3, 2), (2, 6)], [(1, 9)], []]
+    assert sma_star_search(*graph_problem(adj, 4), budget=5)[:2] == ([], INF)
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_memory_bounded_modes_match_a_star(seed):
+    rng = random.Random(seed)
+    for _ in range(300):
+        n = rng.randint(2, 7)
+        adj = [[(v, rng.randint(1, 9)) for v in rng.sample(range(n), rng.randint(0, min(3, n)))]
+               for _ in range(n)]
+        goal = rng.randrange(n)
+        dist = exact_distances(adj, goal)
+        scale = rng.random()
+        problem = graph_problem(adj, goal, lambda s: scale * dist[s] if dist[s] < INF else 0)
+        best_path, best, _ = a_star_search(*problem)
+
+        path, cost, _ = ida_star_search(*problem)
+        assert cost == best
+        for budget in range(2, 8):
+            path, cost, _ = sma_star_search(*problem, budget=budget)
+            if best == INF:
+                assert (path, cost) == ([], INF)
+            elif len(best_path) < budget:
+                assert cost == best and path_cost(adj, path) == cost
+            else:
+                assert cost >= best
+
+
+def test_vacuum_corridor_all_modes(monkeypatch):
+    monkeypatch.setattr(av, "POSITIONS", av.POSITIONS)    # restored even if an assert fails
+    av.configure(6)
+    problem = (av.vac_initial_state(), av.vac_goal_test, av.vac_successors, av.vac_heuristic)
+    _, best, _ = a_star_search(*problem)
+    assert ida_star_search(*problem)[1] == best
+    assert sma_star_search(*problem, budget=40)[1] == best
@@ -0,0 +1,179 @@
+"""
+Lab 03 ▸ Pattern-Database Heuristic for the N-square Vacuum Corridor
+===================================================================
+Takeaways:
+    • Abstraction = keep the robot position and the dirt of one *block* of k
+      squares, forget the rest ⇒ N·2^k abstract states per pattern.
+    • Backward BFS from every "block clean" abstract state gives the exact
+      abstract cost = admissible lower bound for the real problem
+      (sucking outside the block is an abstract self-loop).
+    • Tables are uint8 cost arrays in one binary file (`VPDB` header + block
+      starts + tables), opened with `mmap` ⇒ the heuristic is an O(1) read.
+    • h = max(PDB blocks, extreme-dirt bound) where the bound is
+          #dirty + (R − L) + min(|p − L|, |p − R|)
+      (L / R = leftmost / rightmost dirty square, p = robot).  On a plain
+      corridor that bound is already the exact cost, so the PDB mainly pays
+      off on its own or in worlds where the bound is loose.
+
+Run:
+    python vacuum_pdb.py                             # 8, 12, 16 squares
+    python vacuum_pdb.py --squares 10 --block 6 --trials 5
+"""
+
+import argparse
+import mmap
+import os
+import struct
+import time
+from array import array
+from typing import List, Sequence, Tuple
+
+HEADER = struct.Struct("<4sHHH")                  # magic, squares, block, patterns
+MAGIC = b"VPDB"
+UNREACHED = 255
+
+# ── building ────────────────────────────────────────────────────────────────
+
+def block_starts(squares: int, block: int) -> List[int]:
+    """Starts of blocks tiling 0..squares-1 (the last one is shifted left to fit)."""
+    return sorted({min(s, squares - block) for s in range(0, squares, block)})
+
+
+def build_table(squares: int, block: int, start: int) -> bytearray:
+    """dist[pos << block | submask] = cost to clean squares start..start+block-1."""
+    dist = bytearray([UNREACHED]) * (squares << block)
+    frontier = [p << block for p in range(squares)]           # block already clean
+    for s in frontier:
+        dist[s] = 0
+    d = 0
+    while frontier:
+        d += 1
+        if d >= UNREACHED:
+            raise ValueError("costs exceed uint8 – use a smaller corridor")
+        nxt = []
+        for s in frontier:
+            pos, sub = s >> block, s & ((1 << block) - 1)
+            preds = []
+            if pos > 0:
+                preds.append(s - (1 << block))                 # came by Right
+            if pos < squares - 1:
+                preds.append(s + (1 << block))                 # came by Left
+            b = pos - start
+            if 0 <= b < block and not sub >> b & 1:
+                preds.append(s | 1 << b)                       # came by Suck
+            for t in preds:
+                if dist[t] == UNREACHED:
+                    dist[t] = d
+                    nxt.append(t)
+        frontier = nxt
+    return dist
+
+
+def build_pdb(path: str, squares: int, block: int) -> List[int]:
+    """Write the database for a *squares* corridor; returns the block starts."""
+    block = min(block, squares)
+    starts = block_starts(squares, block)
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(HEADER.pack(MAGIC, squares, block, len(starts)))
+        array("H", starts).tofile(f)
+        for s in starts:
+            f.write(build_table(squares, block, s))
+    os.replace(tmp, path)
+    return starts
+
+# ── lookup (mmap) ───────────────────────────────────────────────────────────
+
+class PatternDatabase:
+    """Read-only view of a `build_pdb` file."""
+
+    def __init__(self, path: str):
+        self._file = open(path, "rb")
+        self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self.squares, self.block, n = HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{path}: not a vacuum pattern database")
+        self.starts = list(struct.unpack_from(f"<{n}H", self._mm, HEADER.size))
+        base = HEADER.size + 2 * n
+        size = self.squares << self.block
+        self._offsets = [base + i * size for i in range(n)]
+        self._low = (1 << self.block) - 1
+
+    def lookup(self, pos: int, dirt: int) -> int:
+        """Max over blocks; *dirt* bit i set ⇔ square i dirty."""
+        mm, k, low = self._mm, self.block, self._low
+        return max(mm[off + (pos << k | (dirt >> s) & low)]
+                   for s, off in zip(self.starts, self._offsets))
+
+    def close(self) -> None:
+        self._mm.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+# ── heuristics on astar_vacuum_cleaner states ───────────────────────────────
+
+def extreme_dirt_bound(pos: int, dirt: int) -> int:
+    if not dirt:
+        return 0
+    left, right = (dirt & -dirt).bit_length() - 1, dirt.bit_length() - 1
+    return bin(dirt).count("1") + (right - left) + min(abs(pos - left), abs(pos - right))
+
+
+def dirt_mask(state: Tuple) -> int:
+    """('B', 'Dirty', 'Clean', …) → 0b…01 (bit i ⇔ square i dirty)."""
+    dirt = 0
+    for i, s in enumerate(state[1:]):
+        if s == "Dirty":
+            dirt |= 1 << i
+    return dirt
+
+
+def pdb_heuristic(pdb: PatternDatabase, positions: Sequence[str], with_bound: bool = True):
+    """h(state) for `astar_vacuum_cleaner` tuples over *positions*."""
+    index = {p: i for i, p in enumerate(positions)}
+
+    def h(state: Tuple) -> int:
+        pos, dirt = index[state[0]], dirt_mask(state)
+        v = pdb.lookup(pos, dirt)
+        return max(v, extreme_dirt_bound(pos, dirt)) if with_bound else v
+    return h
+
+# ── report ──────────────────────────────────────────────────────────────────
+
+if __name__ == "__main__":
+    import random
+
+    import astar_vacuum_cleaner as av
+
+    parser = argparse.ArgumentParser(description="Build a vacuum PDB and compare A* expansions")
+    parser.add_argument("--squares", type=int, nargs="+", default=[8, 12, 16])
+    parser.add_argument("--block", type=int, default=8, help="squares per pattern")
+    parser.add_argument("--trials", type=int, default=3, help="random start states per size")
+    parser.add_argument("--dir", default=".", help="where to write vacuum_<N>.pdb")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    print(f"{'N':>3} {'build s':>8} {'bytes':>8} | {'dirty-count':>11} {'pdb':>9} {'pdb+bound':>9}  (mean A* expansions)")
+    for n in args.squares:
+        av.configure(n)
+        path = os.path.join(args.dir, f"vacuum_{n}.pdb")
+        t0 = time.perf_counter()
+        build_pdb(path, n, args.block)
+        build_s = time.perf_counter() - t0
+        starts = [(rng.choice(av.POSITIONS),) + tuple(rng.choice(("Dirty", "Clean")) for _ in range(n))
+                  for _ in range(args.trials)]
+        with PatternDatabase(path) as pdb:
+            hs = (av.vac_heuristic, pdb_heuristic(pdb, av.POSITIONS, False), pdb_heuristic(pdb, av.POSITIONS))
+            means, costs = [], []
+            for h in hs:
+                runs = [av.a_star_search(s, av.vac_goal_test, av.vac_successors, h) for s in starts]
+                costs.append([cost for _, cost, _ in runs])
+                means.append(sum(expanded for _, _, expanded in runs) / len(runs))
+            assert costs[0] == costs[1] == costs[2], "PDB heuristic lost optimality"
+        print(f"{n:3} {build_s:8.3f} {os.path.getsize(path):8} | {means[0]:11.0f} {means[1]:9.0f} {means[2]:9.0f}")